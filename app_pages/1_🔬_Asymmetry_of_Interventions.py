@@ -0,0 +1,328 @@
+# app_pages/1_🔬_Asymmetry_of_Interventions.py
+
+import textwrap
+import streamlit as st
+
+@st.fragment
+def _static_intro():
+    """Renders the fixed explanatory prose above the simulation."""
+    st.title("🔬 The Asymmetry of Interventions")
+    st.markdown(
+        """
+        On the previous page, we introduced **Structural Causal Models (SCMs)** as a formal language for describing causal processes. Now, we'll see why this framework is so powerful through exploiting properties of **interventions**.
+        """
+    )
+
+    st.divider()
+
+    # --- Section 2: The Fundamental Asymmetry of Causation ---
+    st.header("The Fundamental Asymmetry of Causation")
+    st.markdown(
+        r"""
+        This ability to perform local surgeries reveals the core asymmetry of cause and effect: **intervening on a cause can change its effect, but intervening on an effect does *not* change its cause.**
+
+        Let's demonstrate this with the linear SCM from the textbook (Example 3.2).
+
+        **Ground Truth SCM ($\mathfrak{C}$):** Consider the causal graph $C \to E$ defined by the following linear model, where the noises $N_C$ and $N_E$ are independent standard normal variables ($\mathcal{N}(0,1)$).
+
+        $$
+        \mathfrak{C}: \begin{cases}
+            C &:= N_C \\
+            E &:= 4 \cdot C + N_E
+        \end{cases}
+        $$
+        """
+    )
+
+    col_a, col_b = st.columns(2)
+
+    with col_a:
+        st.subheader("Case 1: Intervening on the Cause")
+        st.markdown(
+            r"""
+            What happens if we intervene and set $C$ to 2?
+
+            $$
+            \text{do}(C := 2)
+            $$
+
+            We replace the first equation. The new SCM defines the post-intervention behavior of $E$. Substituting the new value of $C$ into the equation for $E$ yields $E := 4 \cdot (2) + N_E = 8 + N_E$.
+            """
+        )
+        st.success(r"**Conclusion:** The interventional distribution $P_E^{\mathfrak{C};\text{do}(C:=2)}$ is $\mathcal{N}(8,1)$, a significant change from the observational distribution $P_E^{\mathfrak{C}} = \mathcal{N}(0,17)$.")
+
+    with col_b:
+        st.subheader("Case 2: Intervening on the Effect")
+        st.markdown(
+            r"""
+            What happens if we intervene and set $E$ to 2?
+
+            $$
+            \text{do}(E := 2)
+            $$
+
+            We replace the second equation. The new SCM is:
+            $C := N_C$
+
+            $E := 2$
+
+            Crucially, the mechanism for the cause, $C := N_C$, is **untouched**.
+            """
+        )
+        st.success(r"**Conclusion:** The interventional distribution $P_C^{\mathfrak{C};\text{do}(E:=2)}$ is $\mathcal{N}(0,1)$, which is identical to the original observational distribution $P_C^{\mathfrak{C}}$.")
+
+    st.markdown(
+        r"""
+        This asymmetry highlights the crucial difference between intervention and conditioning. In the observational world, if we *see* that $E=2$, we can infer something about $C$. The conditional distribution $P_{C|E=2}^{\mathfrak{C}}$ is **not** the same as the original distribution of $C$.
+
+        However, if we *force* $E$ to be 2 via an intervention, we break the original system. The interventional distribution $P_C^{\mathfrak{C};\text{do}(E:=2)}$ **is** the same as the original distribution $P_C^{\mathfrak{C}}$.
+        """
+    )
+
+    st.divider()
+
+
+_static_intro()
+
+st.header("Interactive Simulation")
+
+# Deferred until after the static prose so plotly's import cost does not delay it.
+from src.simulations.intervention_sim import generate_observational_data, perform_all_interventions
+from src.plotting.charts import (
+    create_comparison_density_plot, create_density_template, create_scatter_template,
+    update_density_template, update_scatter_template
+)
+
+NOISE_STD = 1.5
+COLOR_X = '#1f77b4'  
+COLOR_Y = '#ff7f0e' 
+INTERVENTION_VALUES_X = [-2, 0, 2]
+INTERVENTION_VALUES_Y = [-5, 0, 5]
+
+X_DISTRIBUTION_LATEX = r"X := N_X \implies X \sim \mathcal{N}(0, 1)"
+
+# Each expander/container is one markdown element with $$ blocks rather than a
+# markdown element plus one st.latex element per equation.
+@st.cache_data
+def display_math(tex):
+    return "$$\n" + textwrap.dedent(tex).strip() + "\n$$"
+
+@st.cache_data
+def scm_latex(b, noise_std):
+    return fr'''
+        \begin{{aligned}}
+            N_X &\sim \mathcal{{N}}(0, 1) \\
+            N_Y &\sim \mathcal{{N}}(0, {noise_std**2:.2f}) \\
+            \\
+            X &:= N_X \\
+            Y &:= {b:.2f} \cdot X + N_Y
+        \end{{aligned}}
+    '''
+
+@st.cache_data
+def var_y_latex(b, noise_std):
+    var_y = b**2 + noise_std**2
+    return fr'''
+        \begin{{aligned}}
+        E[Y] &= E[b \cdot X + N_Y] = b \cdot E[X] + E[N_Y] = 0 \\
+        \operatorname{{Var}}(Y) &= \operatorname{{Var}}(b \cdot X + N_Y) \\
+        &= b^2 \cdot \operatorname{{Var}}(X) + \operatorname{{Var}}(N_Y)
+        \quad (\text{{since $X$ and $N_Y$ are independent}}) \\
+        &= ({b:.2f})^2 \cdot 1^2 + {noise_std**2:.2f} \\
+        &= {var_y:.2f}
+        \end{{aligned}}
+    '''
+
+@st.cache_data
+def y_distribution_latex(b, noise_std):
+    var_y = b**2 + noise_std**2
+    return fr"Y := {b:.2f} \cdot X + N_Y \implies Y \sim \mathcal{{N}}(0, {var_y:.2f})"
+
+@st.cache_data
+def intervention_latex(b, value, noise_std):
+    return fr"Y \sim \mathcal{{N}}({b * value:.2f}, {noise_std**2:.2f})"
+
+
+def slider_seed(samples, b, stream):
+    # Hashing a tuple of numbers is stable across processes. The stream number
+    # gives the observational and interventional draws independent seeds.
+    return hash((samples, b, stream)) & 0xffffffff
+
+# Persisted to disk so server restarts skip the regeneration. Both draws are
+# seeded from the slider values, so a reloaded entry matches a fresh one.
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def cached_generate_observational_data(samples, b):
+    return generate_observational_data(n_samples=samples, slope=b, seed=slider_seed(samples, b, 0))
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=64)
+def cached_perform_all_interventions(samples, b):
+    return perform_all_interventions(
+        INTERVENTION_VALUES_X, INTERVENTION_VALUES_Y, n_samples=samples, slope=b, seed=slider_seed(samples, b, 1)
+    )
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_intervention_fig(var_name, value, samples, b):
+    # One figure per (variable, button value, sliders); a click only looks it up.
+    # cache_data hands each caller its own copy, and max_entries bounds memory.
+    obs = cached_generate_observational_data(samples, b)
+    df_int = cached_perform_all_interventions(samples, b)[var_name]
+    if var_name == 'X':
+        return create_comparison_density_plot(
+            obs.Y, df_int[value], 'Original Y', f'Y after do(X={value})', 'Distribution of Y Shifts', color=COLOR_Y,
+            dropna=False
+        )
+    return create_comparison_density_plot(
+        obs.X, df_int[value], 'Original X', f'X after do(Y={value})', 'Distribution of X is Unchanged', color=COLOR_X,
+        dropna=False
+    )
+
+def session_figure(key, factory):
+    # Each session keeps its own figure skeleton, so updating its traces in
+    # place on a rerun never touches another user's figure.
+    if key not in st.session_state:
+        st.session_state[key] = factory()
+    return st.session_state[key]
+
+def session_observational_data(samples, b):
+    # The last draw is kept under 'obs_df' so reruns with unchanged sliders, and
+    # other pages that want the same sample, skip even the cache-key hash.
+    key = (samples, b)
+    if st.session_state.get('obs_key') != key:
+        st.session_state['obs_df'] = cached_generate_observational_data(samples, b)
+        st.session_state['obs_key'] = key
+    return st.session_state['obs_df']
+
+# The sliders live inside the fragment so dragging them reruns only the
+# simulation below, not the prose above and after it.
+@st.fragment
+def _simulation():
+    """Renders the slider-driven model, observational plots and interventions."""
+    st.markdown("**Simulation Parameters**")
+    col_n, col_b = st.columns(2)
+    with col_n:
+        n_samples = st.slider("Number of Samples", 100, 5000, 1000)
+    with col_b:
+        slope = st.slider("Slope (b)", -5.0, 5.0, 2.0)
+
+    st.subheader("1. The Ground Truth Model")
+    st.markdown("First, we define our ground truth Structural Causal Model (SCM).")
+
+    with st.container(border=True):
+        st.markdown("**Structural Assignments:**\n\n" + display_math(scm_latex(slope, NOISE_STD)))
+
+    st.subheader("2. Observational Data & Theoretical Distributions")
+    st.markdown(
+        """
+        From this SCM, we can derive the theoretical distributions for $X$ and $Y$ that we would expect to see in the observational data.
+        """
+    )
+    with st.expander("Show me the calculations"):
+        st.markdown(
+            "**Distribution of X:**\n\n" + display_math(X_DISTRIBUTION_LATEX)
+            + "\n\n**Distribution of Y:**\n\n" + display_math(var_y_latex(slope, NOISE_STD))
+            # separate LaTeX for the distribution of Y:
+            + "\n\n" + display_math(y_distribution_latex(slope, NOISE_STD))
+        )
+
+
+    # Calculate the variance for Y dynamically
+    var_y = slope**2 + NOISE_STD**2
+    st.success(f"**Theoretical Observational Distributions:** $X \\sim \\mathcal{{N}}(0, 1)$ and $Y \\sim \\mathcal{{N}}(0, {var_y:.2f})$")
+
+    # Generate and Plot Observational Data 
+    obs = session_observational_data(n_samples, slope)
+    col1_obs, col2_obs = st.columns(2)
+    with col1_obs:
+        fig_scatter = session_figure(
+            'obs_scatter_fig', lambda: create_scatter_template('X', 'Y', 'Empirical Observational Data')
+        )
+        update_scatter_template(fig_scatter, obs.X, obs.Y)
+        st.plotly_chart(fig_scatter, use_container_width=True)
+    with col2_obs:
+        fig_obs_density = session_figure(
+            'obs_density_fig', lambda: create_density_template(['Cause (X)', 'Effect (Y)'], 'Empirical Observational Distributions')
+        )
+        update_density_template(fig_obs_density, obs.X, obs.Y, dropna=False)
+        st.plotly_chart(fig_obs_density, use_container_width=True)
+
+
+    st.subheader("3. Perform an Intervention")
+    st.markdown(
+        """
+        Now, pick an intervention to perform a "surgical" intervention. The plot compares the **original** empirical distribution (dashed line) with the **new** distribution (solid line) after intervening on the other variable.
+        """
+    )
+
+    st.markdown(
+        """
+        #### A) Intervene on the Cause (X)
+        What happens to the distribution of the Effect (Y) if we force X to be a specific value?
+        """
+    )
+    # The selection lives in session_state, so the chosen plot survives unrelated reruns
+    sel_x = st.segmented_control(
+        "Intervention on X", options=INTERVENTION_VALUES_X, format_func=lambda v: f"do(X := {v})",
+        key="do_x", label_visibility="collapsed"
+    )
+    if sel_x is not None:
+        st.plotly_chart(build_intervention_fig('X', sel_x, n_samples, slope), use_container_width=True)
+        with st.expander("Show me the theoretical calculation for this intervention"):
+            st.markdown(
+                "The modified SCM becomes: $X := " + str(sel_x) + r"$, so $Y := " + f"{slope:.2f} \\cdot {sel_x} + N_Y$."
+                + "\n\n" + display_math(intervention_latex(slope, sel_x, NOISE_STD))
+            )
+            st.info("Notice how the empirical result (solid line) centers on the new theoretical mean.")
+
+    st.markdown(
+        """
+        #### B) Intervene on the Effect (Y)
+        What happens to the distribution of the Cause (X) if we force Y to be a specific value?
+        """
+    )
+    sel_y = st.segmented_control(
+        "Intervention on Y", options=INTERVENTION_VALUES_Y, format_func=lambda v: f"do(Y := {v})",
+        key="do_y", label_visibility="collapsed"
+    )
+    if sel_y is not None:
+        st.plotly_chart(build_intervention_fig('Y', sel_y, n_samples, slope), use_container_width=True)
+        with st.expander("Show me the theoretical calculation for this intervention"):
+            st.markdown(
+                "The modified SCM becomes: $Y := " + str(sel_y) + r"$, but the mechanism for $X$ is untouched."
+                + "\n\n" + display_math(X_DISTRIBUTION_LATEX)
+            )
+            st.info("The theory predicts no change in the distribution of X, which is exactly what the simulation shows.")
+
+_simulation()
+
+
+
+st.header("The Significance of Asymmetry: Why This Matters")
+st.markdown(
+    """
+    This asymmetry is the key to distinguishing cause from effect and is the conceptual basis for many causal discovery algorithms.
+    """
+)
+
+st.subheader("Revisiting First Principles: Changing the Distribution Itself")
+st.markdown(
+    r"""
+    Let's tie this back to the core idea from our introduction.
+    
+    -   **The Machine Learning Paradigm** assumes we are always working with a **single, fixed joint distribution**, let's call it $P_{obs}(X,Y)$. All statistical operations (like calculating $E[Y|X=x]$) are queries about this one distribution. The world is static.
+    
+    -   **The Causal Paradigm** recognizes that an intervention is an action that **changes the system itself**. When we perform an action like $do(X:=c)$, we are breaking the old rules. This act of intervention *destroys* the original distribution $P_{obs}(X,Y)$ and creates an entirely **new one**, $P_{do(X:=c)}(X,Y)$.
+    
+    The asymmetry we observed is a property of this change.
+    
+    -   When we intervened on the cause ($do(X:=c)$), we created a new world where the distribution of $Y$ was different.
+    -   When we intervened on the effect ($do(Y:=c)$), we also created a new world, but in this specific new world, the distribution of $X$ happened to be the same as it was in the old one.
+    
+    This is the crucial insight: a causal model is not a model of one distribution, but a model of how the distribution **changes** in response to interventions.
+    """
+)
+
+st.success(
+    """
+    **Takeaway:** The asymmetry of interventions is the empirical key that unlocks the difference between mere correlation and true causation. It allows us to test our causal hypotheses and understand not just what *is*, but what *would be* if we were to act.
+    """
+)
\ No newline at end of file
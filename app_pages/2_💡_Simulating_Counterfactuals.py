@@ -1,11 +1,59 @@
 import streamlit as st
 from src.simulations.counterfactual_sim import solve_for_nb, calculate_counterfactual_outcome
 
-st.set_page_config(
-    page_title="Simulation 2: Counterfactuals",
-    page_icon="💡",
-    layout="wide"
-)
+@st.cache_resource
+def _load_flow_image() -> bytes:
+    """Reads the flow diagram once per process; st.image takes the PNG bytes as-is."""
+    with open("assets/counterfactual_flow.png", 'rb') as f:
+        return f.read()
+
+# The factual scenario is fixed, so every derived value and every formatted
+# string below is computed once at import rather than on each rerun.
+FACTUAL_T = 1
+FACTUAL_B = 1
+COUNTERFACTUAL_T = 0
+DEDUCED_NB = solve_for_nb(T=FACTUAL_T, B=FACTUAL_B)
+COUNTERFACTUAL_B = calculate_counterfactual_outcome(deduced_nb=DEDUCED_NB, counterfactual_T=COUNTERFACTUAL_T)
+
+FACTUAL_SCENARIO_MD = f"""
+    **The Factual Scenario:** A specific patient comes to the hospital. We observe the following facts:
+    - The doctor administered the treatment (**$T={FACTUAL_T}$**).
+    - The patient went blind (**$B={FACTUAL_B}$**).
+    
+    **The Counterfactual Question:** What would have happened to this *specific* patient if the doctor had **not** administered the treatment?
+    """
+
+ABDUCTION_MD = f"""
+    First, we use the observed facts ($T={FACTUAL_T}, B={FACTUAL_B}$) to deduce the value of the unobserved exogenous variable, $N_B$, for this individual. We plug the facts into our SCM's equation for $B$:
+    """
+ABDUCTION_LATEX = fr"""
+    \begin{{gathered}}
+    B = T \cdot N_B + (1-T) \cdot (1-N_B) \\
+    {FACTUAL_B} = {FACTUAL_T} \cdot N_B + (1-{FACTUAL_T}) \cdot (1-N_B) \\
+    {FACTUAL_B} = 1 \cdot N_B + 0 \cdot (1-N_B) \implies N_B = {FACTUAL_B}
+    \end{{gathered}}
+    """
+ABDUCTION_CONCLUSION_MD = f"**Conclusion:** For this specific patient, the hidden condition **$N_B$ must have been {DEDUCED_NB}**."
+
+ACTION_LATEX = fr"\text{{Counterfactual Action: }} do(T := {COUNTERFACTUAL_T})"
+ACTION_MD = f"""
+    The original world for this patient was described by the SCM with $N_B={DEDUCED_NB}$. 
+    Our counterfactual world is described by a modified SCM where we have forced $T$ to be ${COUNTERFACTUAL_T}$.
+    """
+
+PREDICTION_MD = f"""
+    Finally, we compute the outcome in this new, hypothetical world using the modified SCM. We use the deduced $N_B={DEDUCED_NB}$ and the counterfactual action $T={COUNTERFACTUAL_T}$.
+    """
+PREDICTION_LATEX = fr"""
+    \begin{{gathered}}
+    B_{{cf}} = T_{{cf}} \cdot N_B + (1-T_{{cf}}) \cdot (1-N_B) \\
+    B_{{cf}} = {COUNTERFACTUAL_T} \cdot {DEDUCED_NB} + (1-{COUNTERFACTUAL_T}) \cdot (1-{DEDUCED_NB}) \\
+    B_{{cf}} = 0 + 1 \cdot {1-DEDUCED_NB} = {COUNTERFACTUAL_B}
+    \end{{gathered}}
+    """
+
+OUTCOME_TEXT = "Cured (B=0)" if COUNTERFACTUAL_B == 0 else "Blind (B=1)"
+CONCLUSION_MD = f"**Conclusion:** Thus, had this patient *not* been treated, they would have been **{OUTCOME_TEXT}**."
 
 st.title("💡 Simulation 2: Counterfactuals")
 st.markdown(
@@ -66,35 +114,15 @@ st.divider()
 # --- Section 2: Interactive Counterfactual Analysis ---
 st.header("Interactive Counterfactual Analysis")
 
-# Define the factual scenario
-FACTUAL_T = 1
-FACTUAL_B = 1
-
-st.info(
-    f"""
-    **The Factual Scenario:** A specific patient comes to the hospital. We observe the following facts:
-    - The doctor administered the treatment (**$T={FACTUAL_T}$**).
-    - The patient went blind (**$B={FACTUAL_B}$**).
-    
-    **The Counterfactual Question:** What would have happened to this *specific* patient if the doctor had **not** administered the treatment?
-    """
-)
+st.info(FACTUAL_SCENARIO_MD)
 
 st.subheader("The Three-Step Process")
 
 # Step 1: Abduction
 with st.expander("#### Step 1: Abduction (The Detective Step)"):
-    st.markdown(
-        f"""
-        First, we use the observed facts ($T={FACTUAL_T}, B={FACTUAL_B}$) to deduce the value of the unobserved exogenous variable, $N_B$, for this individual. We plug the facts into our SCM's equation for $B$:
-        """
-    )
-    st.latex(f"B = T \\cdot N_B + (1-T) \\cdot (1-N_B)")
-    st.latex(f"{FACTUAL_B} = {FACTUAL_T} \\cdot N_B + (1-{FACTUAL_T}) \\cdot (1-N_B)")
-    st.latex(f"{FACTUAL_B} = 1 \\cdot N_B + 0 \\cdot (1-N_B) \implies N_B = {FACTUAL_B}")
-    
-    deduced_nb = solve_for_nb(T=FACTUAL_T, B=FACTUAL_B)
-    st.success(f"**Conclusion:** For this specific patient, the hidden condition **$N_B$ must have been {deduced_nb}**.")
+    st.markdown(ABDUCTION_MD)
+    st.latex(ABDUCTION_LATEX)
+    st.success(ABDUCTION_CONCLUSION_MD)
 
 # Step 2: Action
 with st.expander("#### Step 2: Action (The Time-Traveler Step)"):
@@ -103,32 +131,18 @@ with st.expander("#### Step 2: Action (The Time-Traveler Step)"):
         Next, we take our knowledge about this specific patient (i.e., we fix $N_B$ to its deduced value) and apply our hypothetical action. We use the $do$-operator to replace the original action with our counterfactual one.
         """
     )
-    COUNTERFACTUAL_T = 0
-    st.latex(fr"\text{{Counterfactual Action: }} do(T := {COUNTERFACTUAL_T})")
-    st.markdown(
-        f"""
-        The original world for this patient was described by the SCM with $N_B={deduced_nb}$. 
-        Our counterfactual world is described by a modified SCM where we have forced $T$ to be ${COUNTERFACTUAL_T}$.
-        """
-    )
+    st.latex(ACTION_LATEX)
+    st.markdown(ACTION_MD)
 
 # Step 3: Prediction
 with st.expander("#### Step 3: Prediction (The Prophet Step)"):
-    st.markdown(
-        f"""
-        Finally, we compute the outcome in this new, hypothetical world using the modified SCM. We use the deduced $N_B={deduced_nb}$ and the counterfactual action $T={COUNTERFACTUAL_T}$.
-        """
-    )
-    counterfactual_b = calculate_counterfactual_outcome(deduced_nb=deduced_nb, counterfactual_T=COUNTERFACTUAL_T)
-    st.latex(f"B_{{cf}} = T_{{cf}} \\cdot N_B + (1-T_{{cf}}) \\cdot (1-N_B)")
-    st.latex(f"B_{{cf}} = {COUNTERFACTUAL_T} \\cdot {deduced_nb} + (1-{COUNTERFACTUAL_T}) \\cdot (1-{deduced_nb})")
-    st.latex(f"B_{{cf}} = 0 + 1 \\cdot {1-deduced_nb} = {counterfactual_b}")
+    st.markdown(PREDICTION_MD)
+    st.latex(PREDICTION_LATEX)
 
-st.image("assets/counterfactual_flow.png")
+st.image(_load_flow_image())
 
 
-outcome_text = "Cured (B=0)" if counterfactual_b == 0 else "Blind (B=1)"
-st.markdown(f"**Conclusion:** Thus, had this patient *not* been treated, they would have been **{outcome_text}**.")
+st.markdown(CONCLUSION_MD)
 
 st.markdown(
     """
@@ -195,35 +209,41 @@ st.info(
     """
 )
 
-if 'lab_result' not in st.session_state:
-    st.session_state.lab_result = None
+# The reveal buttons are the only widgets on the page; as a fragment, a click
+# reruns just this block instead of the whole walkthrough above it.
+@st.fragment
+def _lab_result_fragment():
+    if 'lab_result' not in st.session_state:
+        st.session_state.lab_result = None
 
-col_btn1, col_btn2 = st.columns(2)
-if col_btn1.button("Reveal Result: Test shows **$N_B = 1$**", use_container_width=True):
-    st.session_state.lab_result = 'confirmed'
+    col_btn1, col_btn2 = st.columns(2)
+    if col_btn1.button("Reveal Result: Test shows **$N_B = 1$**", use_container_width=True):
+        st.session_state.lab_result = 'confirmed'
 
-if col_btn2.button("Reveal Result: Test shows **$N_B = 0$**", use_container_width=True):
-    st.session_state.lab_result = 'falsified'
+    if col_btn2.button("Reveal Result: Test shows **$N_B = 0$**", use_container_width=True):
+        st.session_state.lab_result = 'falsified'
 
-# Display the outcome based on which button was pressed
-if st.session_state.lab_result == 'confirmed':
-    st.success(
-        """
-        **Outcome: Model Confirmed**
-        
-        The physical evidence ($N_B=1$) perfectly matches our model's deduction. This gives us confidence that our SCM accurately represents the real-world mechanism, and validates our counterfactual conclusion.
-        """
-    )
-elif st.session_state.lab_result == 'falsified':
-    st.error(
-        """
-        **Outcome: Model Falsified!**
-        
-        The physical evidence ($N_B=0$) directly **contradicts** our model's deduction. Our SCM predicted that a patient with $N_B=0$ who receives treatment ($T=1$) *should have been cured* ($B=0$). But this patient went blind.
-        
-        This contradiction proves that our SCM is **wrong**. The real world works differently than our model assumed, and we must revise it. This is how counterfactuals can be falsifiable.
-        """
-    )
+    # Display the outcome based on which button was pressed
+    if st.session_state.lab_result == 'confirmed':
+        st.success(
+            """
+            **Outcome: Model Confirmed**
+
+            The physical evidence ($N_B=1$) perfectly matches our model's deduction. This gives us confidence that our SCM accurately represents the real-world mechanism, and validates our counterfactual conclusion.
+            """
+        )
+    elif st.session_state.lab_result == 'falsified':
+        st.error(
+            """
+            **Outcome: Model Falsified!**
+
+            The physical evidence ($N_B=0$) directly **contradicts** our model's deduction. Our SCM predicted that a patient with $N_B=0$ who receives treatment ($T=1$) *should have been cured* ($B=0$). But this patient went blind.
+
+            This contradiction proves that our SCM is **wrong**. The real world works differently than our model assumed, and we must revise it. This is how counterfactuals can be falsifiable.
+            """
+        )
+
+_lab_result_fragment()
 
 st.header("Why Couldn't a Standard Machine Learning Model Do This?")
 st.markdown(
@@ -1,13 +1,4 @@
 import streamlit as st
-import pandas as pd
-from src.simulations.independence_sim import generate_data, fit_and_get_equation, generate_lingam_data, fit_and_get_residuals
-from src.plotting.charts import create_scatter_plot
-
-st.set_page_config(
-    page_title="Principle of Independent Mechanisms",
-    page_icon="🧠",
-    layout="wide"
-)
 
 st.title("🧠 The Principle of Independent Mechanisms (PIM)")
 st.markdown(
@@ -144,6 +135,34 @@ st.markdown("By searching for the factorization that remains stable across the t
 
 st.divider()
 
+# Deferred until after the static prose so the pandas/plotly import cost does not delay it.
+import pandas as pd
+from src.simulations.independence_sim import generate_data, fit_and_get_equation, generate_lingam_data, fit_and_get_residuals
+from src.plotting.charts import create_scatter_plot
+
+@st.cache_data(max_entries=8)
+def cached_generate_data(environment):
+    return generate_data(environment)
+
+# Seeds are a per-session click counter, so the n-th click draws the same sample
+# in every session and the disk cache serves it across visitors and restarts.
+@st.cache_data(persist="disk", max_entries=32)
+def cached_generate_lingam_data(seed):
+    return generate_lingam_data(seed=seed)
+
+@st.cache_data(max_entries=8)
+def cached_fit_and_get_equation(df, cause_col, effect_col):
+    return fit_and_get_equation(df, cause_col, effect_col)
+
+@st.cache_data(max_entries=8)
+def cached_fit_and_get_residuals(df, cause_col, effect_col):
+    return fit_and_get_residuals(df, cause_col, effect_col)
+
+@st.cache_data(max_entries=8)
+def cached_scatter_plot(df, x_col, y_col, title):
+    # The OLS trendline fit dominates; reruns that keep df reuse the figure.
+    return create_scatter_plot(df, x_col, y_col, title)
+
 # Simulation 1: Discovering the Cause through Invariance
 st.header("Simulation: Discovering the Cause through Invariance")
 st.markdown(
@@ -165,24 +184,24 @@ environment = st.selectbox(
     ("Small Farms", "Industrial Farms")
 )
 
-df = generate_data(environment)
+df = cached_generate_data(environment)
 
 col1_sim, col2_sim = st.columns(2)
 
 with col1_sim:
     st.subheader("Test 1: Causal Direction ($F \\to Y$)")
-    causal_eq = fit_and_get_equation(df, 'Fertilizer', 'Crop_Yield')
+    causal_eq = cached_fit_and_get_equation(df, 'Fertilizer', 'Crop_Yield')
     st.markdown(f"**Fitted Model:** `{causal_eq}`")
     
-    fig_causal = create_scatter_plot(df, 'Fertilizer', 'Crop_Yield', 'Yield vs. Fertilizer')
+    fig_causal = cached_scatter_plot(df, 'Fertilizer', 'Crop_Yield', 'Yield vs. Fertilizer')
     st.plotly_chart(fig_causal, use_container_width=True)
 
 with col2_sim:
     st.subheader("Test 2: Anti-Causal Direction ($Y \\to F$)")
-    anticausal_eq = fit_and_get_equation(df, 'Crop_Yield', 'Fertilizer')
+    anticausal_eq = cached_fit_and_get_equation(df, 'Crop_Yield', 'Fertilizer')
     st.markdown(f"**Fitted Model:** `{anticausal_eq}`")
     
-    fig_anticausal = create_scatter_plot(df, 'Crop_Yield', 'Fertilizer', 'Fertilizer vs. Yield')
+    fig_anticausal = cached_scatter_plot(df, 'Crop_Yield', 'Fertilizer', 'Fertilizer vs. Yield')
     st.plotly_chart(fig_anticausal, use_container_width=True)
 
 st.success(
@@ -251,28 +270,28 @@ with st.expander("Show the Ground Truth SCM"):
 
 
 if st.button("Generate New Non-Gaussian Data"):
-    st.session_state.lingam_df = generate_lingam_data()
+    st.session_state.lingam_seed = st.session_state.get('lingam_seed', 0) + 1
 
-if 'lingam_df' in st.session_state:
-    df_lingam = st.session_state.lingam_df
+if 'lingam_seed' in st.session_state:
+    df_lingam = cached_generate_lingam_data(st.session_state.lingam_seed)
     
     col1_lingam, col2_lingam = st.columns(2)
     
     with col1_lingam:
         st.subheader("Test 1: Causal Direction ($X \\to Y$)")
-        residuals_causal = fit_and_get_residuals(df_lingam, 'X', 'Y')
+        residuals_causal = cached_fit_and_get_residuals(df_lingam, 'X', 'Y')
         df_causal_analysis = pd.DataFrame({'Cause (X)': df_lingam['X'], 'Inferred Noise (Residuals)': residuals_causal})
         
-        fig_causal = create_scatter_plot(df_causal_analysis, 'Cause (X)', 'Inferred Noise (Residuals)', 'Independence of Cause and Noise')
+        fig_causal = cached_scatter_plot(df_causal_analysis, 'Cause (X)', 'Inferred Noise (Residuals)', 'Independence of Cause and Noise')
         st.plotly_chart(fig_causal, use_container_width=True)
         st.success("**Observation:** The inferred noise (residuals) forms a shapeless, random cloud. It appears statistically **independent** of the cause, as the PIM predicts for the correct causal direction.")
 
     with col2_lingam:
         st.subheader("Test 2: Anti-Causal Direction ($Y \\to X$)")
-        residuals_anticausal = fit_and_get_residuals(df_lingam, 'Y', 'X')
+        residuals_anticausal = cached_fit_and_get_residuals(df_lingam, 'Y', 'X')
         df_anticausal_analysis = pd.DataFrame({'Cause (Y)': df_lingam['Y'], 'Inferred Noise (Residuals)': residuals_anticausal})
 
-        fig_anticausal = create_scatter_plot(df_anticausal_analysis, 'Cause (Y)', 'Inferred Noise (Residuals)', 'Dependence of Cause and Noise')
+        fig_anticausal = cached_scatter_plot(df_anticausal_analysis, 'Cause (Y)', 'Inferred Noise (Residuals)', 'Dependence of Cause and Noise')
         st.plotly_chart(fig_anticausal, use_container_width=True)
         st.error("**Observation:** The inferred noise has a clear, sharp, parallelogram-like structure. It is statistically **dependent** on the cause. This violates the PIM, telling us this is the wrong causal direction.")
 
@@ -1,14 +1,37 @@
 import streamlit as st
-import statsmodels.formula.api as smf
-
-from src.simulations.confounding_vs_mediation_sim import generate_confounding_data, generate_mediation_data
+from src.simulations.confounding_vs_mediation_sim import generate_confounding_data, generate_mediation_data, fit_ols
 from src.plotting.charts import create_scatter_plot, create_colored_scatter_plot
 
-st.set_page_config(
-    page_title="Confounding vs. Mediation",
-    page_icon="🔗",
-    layout="wide"
-)
+# DOT sources for the diagrams.
+CONFOUNDING_DOT = """digraph { rankdir=LR; Z [label="Holiday Season (Z)"]; X [label="Ad Spend (X)"]; Y [label="Sales (Y)"]; Z -> X; Z -> Y; X -> Y [style=dashed, label="small true effect"];}"""
+MEDIATION_DOT = """digraph { rankdir=LR; X [label="Ad Spend (X)"]; Z [label="Website Clicks (Z)"]; Y [label="Sales (Y)"]; X -> Z -> Y;}"""
+CONFOUNDER_RULE_DOT = """digraph { rankdir=LR; Z [label="Confounder"]; X; Y; Z -> X; Z -> Y;}"""
+MEDIATOR_RULE_DOT = """digraph { rankdir=LR; Z [label="Mediator"]; X -> Z -> Y;}"""
+
+# Each dataset is drawn once, so toggling a checkbox compares both models on the
+# same sample and only swaps which cached coefficient dict is displayed.
+@st.cache_data
+def cached_generate_confounding_data():
+    return generate_confounding_data()
+
+@st.cache_data
+def cached_generate_mediation_data():
+    return generate_mediation_data()
+
+@st.cache_data
+def cached_fit_ols(df, target, regressors):
+    # Only the coefficients are cached, as plain floats, so each entry pickles
+    # to a few bytes regardless of the sample size.
+    return {name: float(value) for name, value in fit_ols(df, target, list(regressors)).items()}
+
+# The figures depend only on the cached datasets, so each is built once.
+@st.cache_data
+def cached_confounding_scatter():
+    return create_colored_scatter_plot(cached_generate_confounding_data(), 'Ad_Spend', 'Sales', 'Holiday_Season', 'Sales vs. Ad Spend (Colored by Confounder)')
+
+@st.cache_data
+def cached_mediation_scatter():
+    return create_scatter_plot(cached_generate_mediation_data(), 'Ad_Spend', 'Sales', 'Sales vs. Ad Spend (Total Effect)')
 
 st.title("🔗 Confounding vs. Mediation")
 st.markdown(
@@ -30,10 +53,12 @@ st.markdown(
 )
 
 # Causal graph for confounding
-st.graphviz_chart("""digraph { rankdir=LR; Z [label="Holiday Season (Z)"]; X [label="Ad Spend (X)"]; Y [label="Sales (Y)"]; Z -> X; Z -> Y; X -> Y [style=dashed, label="small true effect"];}""")
+st.graphviz_chart(CONFOUNDING_DOT)
 
 with st.container(border=True):
-    st.latex(r'''
+    st.markdown(
+        r"""
+        $$
         \begin{aligned}
             N_Z &\sim \text{Bernoulli}(0.2) \\
             N_X &\sim \mathcal{N}(5, 2^2), \quad N_Y \sim \mathcal{N}(50, 5^2) \\
@@ -42,20 +67,25 @@ with st.container(border=True):
             X &:= 20 \cdot Z + N_X \\
             Y &:= 50 \cdot Z + 2 \cdot X + N_Y
         \end{aligned}
-    ''')
-    st.markdown("Note the true causal effect of $X$ on $Y$ has a coefficient of **2.0**.")
+        $$
+
+        Note the true causal effect of $X$ on $Y$ has a coefficient of **2.0**.
+        """
+    )
 
 # Generate confounding data
-df_confounding = generate_confounding_data()
+df_confounding = cached_generate_confounding_data()
 
 col1, col2 = st.columns([1, 1])
 with col1:
     st.subheader("Visual Evidence")
     st.markdown("The scatter plot shows the observational data. The colors reveal the influence of the confounder, creating two distinct groups of data.")
-    fig_colored = create_colored_scatter_plot(df_confounding, 'Ad_Spend', 'Sales', 'Holiday_Season', 'Sales vs. Ad Spend (Colored by Confounder)')
+    fig_colored = cached_confounding_scatter()
     st.plotly_chart(fig_colored, use_container_width=True)
 
-with col2:
+# Only this column reruns when its checkbox is toggled.
+@st.fragment
+def _confounding_analysis(df_confounding):
     st.subheader("Statistical Analysis")
     st.markdown("Use the toggle below to see how adjusting for the confounder changes the result.")
     
@@ -63,17 +93,19 @@ with col2:
     
     if adjust_confounder:
         st.markdown("##### Corrected Analysis (Adjusted)")
-        model_adjusted = smf.ols('Sales ~ Ad_Spend + Holiday_Season', data=df_confounding).fit()
-        p = model_adjusted.params
+        p = cached_fit_ols(df_confounding, 'Sales', ('Ad_Spend', 'Holiday_Season'))
         st.code(f"Sales ≈ {p['Ad_Spend']:.2f} * Ad_Spend + {p['Holiday_Season']:.2f} * Holiday_Season + {p['Intercept']:.2f}")
         st.success(f"**Conclusion:** After adjusting, the coefficient for Ad Spend is **{p['Ad_Spend']:.2f}**. This is very close to the true causal effect of **2.0**.")
     else:
         st.markdown("##### Naive Analysis (Unadjusted)")
-        model_naive = smf.ols('Sales ~ Ad_Spend', data=df_confounding).fit()
-        p = model_naive.params
+        p = cached_fit_ols(df_confounding, 'Sales', ('Ad_Spend',))
         st.code(f"Sales ≈ {p['Ad_Spend']:.2f} * Ad_Spend + {p['Intercept']:.2f}")
         st.warning(f"**Conclusion:** The naive analysis shows a large coefficient of **{p['Ad_Spend']:.2f}**, which is misleadingly inflated by the confounder.")
-        
+
+
+with col2:
+    _confounding_analysis(df_confounding)
+
 st.divider()
 
 # SCENARIO 2: MEDIATION 
@@ -84,10 +116,12 @@ st.markdown(
     """
 )
 
-st.graphviz_chart("""digraph { rankdir=LR; X [label="Ad Spend (X)"]; Z [label="Website Clicks (Z)"]; Y [label="Sales (Y)"]; X -> Z -> Y;}""")
+st.graphviz_chart(MEDIATION_DOT)
 
 with st.container(border=True):
-    st.latex(r'''
+    st.markdown(
+        r"""
+        $$
         \begin{aligned}
             N_X &\sim \text{Uniform}(1, 10) \\
             N_Z &\sim \mathcal{N}(10, 5^2), \quad N_Y \sim \mathcal{N}(20, 10^2) \\
@@ -96,19 +130,22 @@ with st.container(border=True):
             Z &:= 10 \cdot X + N_Z \\
             Y &:= 5 \cdot Z + N_Y
         \end{aligned}
-    ''')
+        $$
+        """
+    )
 
 # Generate mediation data
-df_mediation = generate_mediation_data()
+df_mediation = cached_generate_mediation_data()
 
 col3, col4 = st.columns([1, 1])
 with col3:
     st.subheader("Visual Evidence")
     st.markdown("The scatter plot shows the strong *total effect* of Ad Spend on Sales. The entire effect flows through the mediator, Website Clicks.")
-    fig_total = create_scatter_plot(df_mediation, 'Ad_Spend', 'Sales', 'Sales vs. Ad Spend (Total Effect)')
+    fig_total = cached_mediation_scatter()
     st.plotly_chart(fig_total, use_container_width=True)
 
-with col4:
+@st.fragment
+def _mediation_analysis(df_mediation):
     st.subheader("Statistical Analysis")
     st.markdown("Use the toggle to see what happens when you mistakenly adjust for the mediator.")
     
@@ -116,17 +153,19 @@ with col4:
     
     if adjust_mediator:
         st.markdown("##### Incorrect Analysis (Adjusted)")
-        model_blocked = smf.ols('Sales ~ Ad_Spend + Website_Clicks', data=df_mediation).fit()
-        p = model_blocked.params
+        p = cached_fit_ols(df_mediation, 'Sales', ('Ad_Spend', 'Website_Clicks'))
         st.code(f"Sales ≈ {p['Ad_Spend']:.2f} * Ad_Spend + {p['Website_Clicks']:.2f} * Website_Clicks + {p['Intercept']:.2f}")
         st.error(f"**Conclusion:** After adjusting, the coefficient for Ad Spend is **{p['Ad_Spend']:.2f}**. This is wrong! By controlling for the mediator, we blocked the causal path, making it seem like ads have no effect.")
     else:
         st.markdown("##### Correct Analysis (Total Effect)")
-        model_total_effect = smf.ols('Sales ~ Ad_Spend', data=df_mediation).fit()
-        p = model_total_effect.params
+        p = cached_fit_ols(df_mediation, 'Sales', ('Ad_Spend',))
         st.code(f"Sales ≈ {p['Ad_Spend']:.2f} * Ad_Spend + {p['Intercept']:.2f}")
         st.success(f"**Conclusion:** The unadjusted model correctly shows the strong, positive **total effect** of Ad Spend on Sales, with a coefficient of **{p['Ad_Spend']:.2f}**.")
 
+
+with col4:
+    _mediation_analysis(df_mediation)
+
 st.divider()
 
 st.header("The Rules of Adjustment")
@@ -136,7 +175,7 @@ rule1, rule2 = st.columns(2)
 with rule1:
     with st.container(border=True):
         st.subheader("Rule 1: Adjust for Confounders")
-        st.graphviz_chart("""digraph { rankdir=LR; Z [label="Confounder"]; X; Y; Z -> X; Z -> Y;}""")
+        st.graphviz_chart(CONFOUNDER_RULE_DOT)
         st.success(
             """
             **You SHOULD adjust for a common cause (confounder).** This blocks the non-causal "back-door" path from X to Y, removing spurious correlation and isolating the true causal effect of X on Y.
@@ -146,7 +185,7 @@ with rule1:
 with rule2:
     with st.container(border=True):
         st.subheader("Rule 2: Do NOT Adjust for Mediators")
-        st.graphviz_chart("""digraph { rankdir=LR; Z [label="Mediator"]; X -> Z -> Y;}""")
+        st.graphviz_chart(MEDIATOR_RULE_DOT)
         st.error(
             """
             **You SHOULD NOT adjust for a variable on the causal pathway (a mediator)** if you want to estimate the total effect of X on Y. This blocks the very mechanism you are trying to measure, leading to an incorrect estimate.
@@ -1,13 +1,30 @@
 import streamlit as st
-import pandas as pd
 import src.simulations.d_separation_sim as sim
 import src.plotting.charts as charts
 
-st.set_page_config(
-    page_title="Causal Markov Property",
-    page_icon="🗺️",
-    layout="wide"
-)
+# DOT sources for the diagrams; the health graph is drawn twice on this page.
+HEALTH_GRAPH_DOT = """
+    digraph {
+        rankdir=LR;
+        node [shape=circle, style="filled", fillcolor=lightblue];
+        
+        Z1 [label="Genetics"];
+        Z2 [label="Lifestyle"];
+        X [label="Cholesterol"];
+        Y [label="Heart Disease"];
+        Z3 [label="Medication"];
+        
+        Z1 -> X;
+        Z1 -> Y;
+        Z2 -> X;
+        Z2 -> Y;
+        X -> Y;
+        Z3 -> Y;
+    }
+"""
+CHAIN_DOT = "digraph { rankdir=LR; X -> Z -> Y }"
+FORK_DOT = "digraph { rankdir=LR; Z -> X; Z -> Y }"
+COLLIDER_DOT = "digraph { rankdir=LR; X -> Z; Y -> Z }"
 
 st.title("🗺️ The Causal Markov Property & d-Separation")
 st.markdown(
@@ -27,25 +44,7 @@ st.markdown(
     """
 )
 
-st.graphviz_chart("""
-    digraph {
-        rankdir=LR;
-        node [shape=circle, style="filled", fillcolor=lightblue];
-        
-        Z1 [label="Genetics"];
-        Z2 [label="Lifestyle"];
-        X [label="Cholesterol"];
-        Y [label="Heart Disease"];
-        Z3 [label="Medication"];
-        
-        Z1 -> X;
-        Z1 -> Y;
-        Z2 -> X;
-        Z2 -> Y;
-        X -> Y;
-        Z3 -> Y;
-    }
-""")
+st.graphviz_chart(HEALTH_GRAPH_DOT)
 
 st.info(
     """
@@ -101,22 +100,42 @@ st.markdown(
 )
 
 st.sidebar.header("Simulation Parameters")
-n_samples = st.sidebar.slider("Number of Samples", 100, 2000, 500, key="dsep_samples")
+# A fixed ladder of sizes keeps the caches below to a handful of entries per
+# structure instead of one per slider position.
+SAMPLE_SIZES = [100, 200, 500, 1000, 2000]
+n_samples = st.sidebar.select_slider("Number of Samples", options=SAMPLE_SIZES, value=500, key="dsep_samples")
 
 @st.cache_data
 def cached_generate_data(structure_type, n_samples):
-    return sim.generate_data(structure_type, n_samples)
+    # The residuals only depend on the sample, so they are cached with it and
+    # the "Condition on Z" checkbox just picks which arrays to plot.
+    data = sim.generate_data(structure_type, n_samples)
+    res_x, res_y = sim.get_residual_pair(data, 'X', 'Y', 'Z')
+    return data, res_x, res_y
+
+@st.cache_data
+def cached_scatter_plot(structure_type, n_samples, condition_on_z):
+    # Keyed by the widget values rather than the data, so a hit hashes three
+    # scalars and skips rebuilding the figure and its OLS trendline.
+    data, res_x, res_y = cached_generate_data(structure_type, n_samples)
+    if condition_on_z:
+        return charts.create_scatter_plot_xy(res_x, res_y, 'X (Residuals)', 'Y (Residuals)', 'X vs. Y (Conditioned on Z)')
+    return charts.create_scatter_plot_xy(data.X, data.Y, 'X', 'Y', 'Observational Data: X vs. Y')
 
 # Tabs for the 3 Structures 
 tab1, tab2, tab3 = st.tabs(["**Structure 1: The Chain (Mediation)**", "**Structure 2: The Fork (Confounding)**", "**Structure 3: The Collider (v-structure)**"])
 
-with tab1:
+# Each tab is a fragment, so its "Condition on Z" checkbox reruns only that tab.
+@st.fragment
+def _chain_tab(n_samples):
     st.subheader("Structure 1: The Chain (Mediation)")
-    st.graphviz_chart("digraph { rankdir=LR; X -> Z -> Y }")
+    st.graphviz_chart(CHAIN_DOT)
     
     # SCM Expander for Chain 
     with st.expander("Show the underlying Structural Causal Model (SCM)"):
-        st.latex(r'''
+        st.markdown(
+            r"""
+            $$
             \begin{aligned}
                 N_X, N_Z, N_Y &\sim \mathcal{N}(0, 1) \quad (\text{independent}) \\
                 \\
@@ -124,7 +143,9 @@ with tab1:
                 Z &:= 1.5 \cdot X + N_Z \\
                 Y &:= 2.0 \cdot Z + N_Y
             \end{aligned}
-        ''')
+            $$
+            """
+        )
     
     st.markdown(
         """
@@ -134,28 +155,29 @@ with tab1:
         """
     )
     
-    df_chain = cached_generate_data('chain', n_samples)
     condition_chain = st.checkbox("Condition on Z (the Mediator)", value=False, key='chain')
     
     if condition_chain:
-        res_x = sim.get_residuals(df_chain, 'X', 'Z')
-        res_y = sim.get_residuals(df_chain, 'Y', 'Z')
-        plot_df = pd.DataFrame({'X (Residuals)': res_x, 'Y (Residuals)': res_y})
-        fig = charts.create_scatter_plot(plot_df, 'X (Residuals)', 'Y (Residuals)', 'X vs. Y (Conditioned on Z)')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(cached_scatter_plot('chain', n_samples, True), use_container_width=True)
         st.success("**Result:** The correlation vanishes! By conditioning on the mediator $Z$, we have blocked the flow of information from $X$ to $Y$.")
     else:
-        fig = charts.create_scatter_plot(df_chain, 'X', 'Y', 'Observational Data: X vs. Y')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(cached_scatter_plot('chain', n_samples, False), use_container_width=True)
         st.info("**Result:** $X$ and $Y$ are clearly correlated, as expected.")
 
-with tab2:
+
+with tab1:
+    _chain_tab(n_samples)
+
+@st.fragment
+def _fork_tab(n_samples):
     st.subheader("Structure 2: The Fork (Confounding)")
-    st.graphviz_chart("digraph { rankdir=LR; Z -> X; Z -> Y }")
+    st.graphviz_chart(FORK_DOT)
 
     # SCM Expander for Fork 
     with st.expander("Show the underlying Structural Causal Model (SCM)"):
-        st.latex(r'''
+        st.markdown(
+            r"""
+            $$
             \begin{aligned}
                 N_Z, N_X, N_Y &\sim \mathcal{N}(0, 1) \quad (\text{independent}) \\
                 \\
@@ -163,7 +185,9 @@ with tab2:
                 X &:= 1.5 \cdot Z + N_X \\
                 Y &:= 2.0 \cdot Z + N_Y
             \end{aligned}
-        ''')
+            $$
+            """
+        )
 
     st.markdown(
         """
@@ -173,28 +197,29 @@ with tab2:
         """
     )
     
-    df_fork = cached_generate_data('fork', n_samples)
     condition_fork = st.checkbox("Condition on Z (the Confounder)", value=False, key='fork')
     
     if condition_fork:
-        res_x = sim.get_residuals(df_fork, 'X', 'Z')
-        res_y = sim.get_residuals(df_fork, 'Y', 'Z')
-        plot_df = pd.DataFrame({'X (Residuals)': res_x, 'Y (Residuals)': res_y})
-        fig = charts.create_scatter_plot(plot_df, 'X (Residuals)', 'Y (Residuals)', 'X vs. Y (Conditioned on Z)')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(cached_scatter_plot('fork', n_samples, True), use_container_width=True)
         st.success("**Result:** The (spurious) correlation vanishes! By conditioning on the common cause $Z$, we have blocked the non-causal path and correctly identified that there is no direct link between $X$ and $Y$.")
     else:
-        fig = charts.create_scatter_plot(df_fork, 'X', 'Y', 'Observational Data: X vs. Y')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(cached_scatter_plot('fork', n_samples, False), use_container_width=True)
         st.info("**Result:** $X$ and $Y$ are correlated due to their common cause $Z$.")
 
-with tab3:
+
+with tab2:
+    _fork_tab(n_samples)
+
+@st.fragment
+def _collider_tab(n_samples):
     st.subheader("Structure 3: The Collider (v-structure)")
-    st.graphviz_chart("digraph { rankdir=LR; X -> Z; Y -> Z }")
+    st.graphviz_chart(COLLIDER_DOT)
 
     # SCM Expander for Collider 
     with st.expander("Show the underlying Structural Causal Model (SCM)"):
-        st.latex(r'''
+        st.markdown(
+            r"""
+            $$
             \begin{aligned}
                 N_X, N_Y, N_Z &\sim \mathcal{N}(0, 1) \quad (\text{independent}) \\
                 \\
@@ -202,7 +227,9 @@ with tab3:
                 Y &:= N_Y \\
                 Z &:= 2.0 \cdot X + 1.5 \cdot Y + N_Z
             \end{aligned}
-        ''')
+            $$
+            """
+        )
 
     st.markdown(
         """
@@ -212,21 +239,19 @@ with tab3:
         """
     )
     
-    df_collider = cached_generate_data('collider', n_samples)
     condition_collider = st.checkbox("Condition on Z (the Collider)", value=False, key='collider')
     
     if condition_collider:
-        res_x = sim.get_residuals(df_collider, 'X', 'Z')
-        res_y = sim.get_residuals(df_collider, 'Y', 'Z')
-        plot_df = pd.DataFrame({'X (Residuals)': res_x, 'Y (Residuals)': res_y})
-        fig = charts.create_scatter_plot(plot_df, 'X (Residuals)', 'Y (Residuals)', 'X vs. Y (Conditioned on Z)')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(cached_scatter_plot('collider', n_samples, True), use_container_width=True)
         st.error("**Result:** A correlation *appears*! By conditioning on the common effect $Z$, we have created a new, non-causal dependency between $X$ and $Y$.")
     else:
-        fig = charts.create_scatter_plot(df_collider, 'X', 'Y', 'Observational Data: X vs. Y')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(cached_scatter_plot('collider', n_samples, False), use_container_width=True)
         st.info("**Result:** $X$ and $Y$ are independent and uncorrelated, as expected. They are two separate causes.")
 
+
+with tab3:
+    _collider_tab(n_samples)
+
 st.divider()
 
 st.header("Putting It All Together: How d-Separation Works")
@@ -247,31 +272,18 @@ st.markdown(
 st.subheader("Example: Applying the Rules to the 'Health' Graph")
 st.markdown("Let's use these rules on our original graph to make two predictions:")
 
-st.graphviz_chart("""
-    digraph {
-        rankdir=LR;
-        node [shape=circle, style="filled", fillcolor=lightblue];
-        
-        Z1 [label="Genetics"];
-        Z2 [label="Lifestyle"];
-        X [label="Cholesterol"];
-        Y [label="Heart Disease"];
-        Z3 [label="Medication"];
-        
-        Z1 -> X;
-        Z1 -> Y;
-        Z2 -> X;
-        Z2 -> Y;
-        X -> Y;
-        Z3 -> Y;
-    }
-""")
+st.graphviz_chart(HEALTH_GRAPH_DOT)
 
 col_ex1, col_ex2 = st.columns(2)
 with col_ex1:
     with st.container(border=True):
-        st.markdown("**Test 1: Are Genetics ($Z_1$) and Lifestyle ($Z_2$) independent?**")
-        st.latex(r"Z_1 \perp\kern-5pt\perp Z_2 \mid \emptyset")
+        st.markdown(
+            r"""
+            **Test 1: Are Genetics ($Z_1$) and Lifestyle ($Z_2$) independent?**
+
+            $$Z_1 \perp\kern-5pt\perp Z_2 \mid \emptyset$$
+            """
+        )
         st.markdown(
             """
             1.  **Find Paths:** There is only one path: $Z_1 \\to X \leftarrow Z_2$.
@@ -283,8 +295,13 @@ with col_ex1:
         )
 with col_ex2:
     with st.container(border=True):
-        st.markdown("**Test 2: Are they independent *given* Cholesterol ($X$)?**")
-        st.latex(r"Z_1 \perp\kern-5pt\perp Z_2 \mid X")
+        st.markdown(
+            r"""
+            **Test 2: Are they independent *given* Cholesterol ($X$)?**
+
+            $$Z_1 \perp\kern-5pt\perp Z_2 \mid X$$
+            """
+        )
         st.markdown(
             """
             1.  **Find Paths:** Same path: $Z_1 \\to X \leftarrow Z_2$.
@@ -333,11 +350,16 @@ with col_markov:
             This is the "read" rule we've been using. It states that if your graph $\mathcal{G}$ is the true causal model for a probability distribution $P$, then $P$ *must* contain all the independencies that are implied by d-separation in $\mathcal{G}$.
             """
         )
-        st.latex(r'''
+        st.markdown(
+            r"""
+            $$
             \text{For any disjoint sets } A, B, Z: \\
             A \perp\kern-5pt\perp_{\mathcal{G}} B \mid Z \implies A \perp\kern-5pt\perp_{P} B \mid Z
-        ''')
-        st.markdown("**In English:** If a path is blocked in the graph, you are guaranteed to find a statistical independence in the data.")
+            $$
+
+            **In English:** If a path is blocked in the graph, you are guaranteed to find a statistical independence in the data.
+            """
+        )
 
 with col_faith:
     with st.container(border=True):
@@ -348,11 +370,16 @@ with col_faith:
             This is the "reverse" rule, and it's an *assumption*. It states that the *only* independencies present in the distribution $P$ are the ones implied by the Causal Markov Property.
             """
         )
-        st.latex(r'''
+        st.markdown(
+            r"""
+            $$
             \text{For any disjoint sets } A, B, Z: \\
             A \perp\kern-5pt\perp_{P} B \mid Z \implies A \perp\kern-5pt\perp_{\mathcal{G}} B \mid Z
-        ''')
-        st.markdown('**In English:** If you find a statistical independence in the data, you can assume it is because a path is blocked in the graph. The data is not "lying" with coincidental independencies.')
+            $$
+
+            **In English:** If you find a statistical independence in the data, you can assume it is because a path is blocked in the graph. The data is not "lying" with coincidental independencies.
+            """
+        )
 
 
 st.success(
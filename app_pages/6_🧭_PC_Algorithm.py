@@ -1,102 +1,11 @@
 import streamlit as st
 import pandas as pd
-import networkx as nx
-import pingouin as pg
 import graphviz
-from itertools import combinations, permutations
-from typing import List, Dict, Set, Tuple
 
 import src.simulations.pc_simulation as sim
 import src.plotting.charts as charts
-from src.algorithms.pc_algorithm import pc_step_2_orient_colliders, pc_step_3_orient_remaining
-
-import src.simulations.independence_sim as sim_indep
-
-st.set_page_config(
-    page_title="PC Algorithm",
-    page_icon="🧭",
-    layout="wide"
-)
-
-
-def _get_neighbors(graph: nx.Graph, node) -> Set:
-    """Helper to get the set of current neighbors for a node."""
-    return set(graph.neighbors(node))
-
-def partial_correlation_test(data: pd.DataFrame, i: str, j: str, S: Set[str], alpha: float, log: List[str]) -> bool:
-    """
-    Performs a conditional independence test using partial correlation.
-    Returns True if independent (p > alpha), False otherwise.
-    """
-    n_samples = len(data)
-    if n_samples < len(S) + 3:
-        log.append(f"SKIPPED: {i} _||_ {j} | {S} (n_samples={n_samples} is too small for |S|={len(S)})")
-        return False # Conservatively assume dependence
-
-    try:
-        result = pg.partial_corr(data=data, x=i, y=j, covar=list(S) if S else None)
-        p_value = result['p-val'].iloc[0]
-        
-        is_independent = p_value > alpha
-        
-        verdict = "INDEPENDENT" if is_independent else "Dependent"
-        log.append(f"Test: {i} _||_ {j} | {S}?  p-val: {p_value:.4f} > {alpha}.  Verdict: {verdict}")
-        
-        return is_independent
-    except Exception as e:
-        log.append(f"ERROR: {i} _||_ {j} | {S}. Error: {e}")
-        return False # Conservatively assume dependence
-
-def pc_step_1_skeleton_with_logging(data: pd.DataFrame, alpha: float) -> Tuple[nx.Graph, Dict, List[str]]:
-    """
-    Executes Step 1 of the PC algorithm to find the graph skeleton.
-    Returns the skeleton, sepset dictionary, and a debug log.
-    """
-    nodes = list(data.columns)
-    skeleton = nx.complete_graph(nodes)
-    sepset = {}
-    log = []
-    
-    k = 0
-    while True:
-        k_changed = False
-        log.append(f"--- Testing with conditioning set size k = {k} ---")
-        edges_to_remove = []
-        
-        # Iterate over a copy of edges, as we modify the graph
-        for (i, j) in list(skeleton.edges()):
-            adj_i = _get_neighbors(skeleton, i) - {j}
-            adj_j = _get_neighbors(skeleton, j) - {i}
-            
-            found_separator = False
-            
-            # Use the smaller adjacency set for efficiency
-            adj_set = adj_i if len(adj_i) <= len(adj_j) else adj_j
-            
-            if len(adj_set) >= k:
-                for S in combinations(adj_set, k):
-                    if partial_correlation_test(data, i, j, set(S), alpha, log):
-                        edges_to_remove.append((i, j))
-                        sepset[(i, j)] = set(S)
-                        sepset[(j, i)] = set(S)
-                        k_changed = True
-                        found_separator = True
-                        log.append(f"REMOVING edge {i} -- {j} based on S = {S}")
-                        break
-            if found_separator:
-                continue
-        
-        skeleton.remove_edges_from(edges_to_remove)
-            
-        k += 1
-        
-        # Check if we can even form a conditioning set of size k
-        if all(len(_get_neighbors(skeleton, n)) < k for n in nodes):
-            log.append(f"Stopping: No node has {k} neighbors left.")
-            break
-            
-    log.append("--- Skeleton search complete ---")
-    return skeleton, sepset, log
+from src.algorithms.pc_algorithm import format_ci_log, run_pc
+from src.utils import ols
 
 st.title("🧭 The PC Algorithm")
 st.markdown(
@@ -180,23 +89,47 @@ n_samples = 2000
 alpha = 0.05
 debug_mode = st.sidebar.checkbox("Show CI Test Log (Debug Mode)", value=False)
 
+# A fixed seed keeps the cache keys stable, so repeat clicks are a cache lookup
+# and the disk cache serves every session and survives restarts
+SEED = 1
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=8)
+def cached_run_pc(n_samples, alpha, seed, log_enabled):
+    data = sim.generate_diamond_data(n_samples, seed=seed)
+    skeleton, sepset, pdag1, pdag2, log = run_pc(data, alpha, log=[] if log_enabled else None)
+    return data, skeleton, sepset, pdag1, pdag2, log
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def cached_format_ci_log(log):
+    return format_ci_log(log)
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=8)
+def cached_generate_interventional_data(n_samples, seed):
+    return sim.generate_diamond_interventional_data(n_samples=n_samples, seed=seed)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def cached_residual_plots(df, label_suffix="", title_suffix=""):
+    a, b = df['A'].to_numpy(), df['B'].to_numpy()
+    res_B_on_A, res_A_on_B = ols.univariate_residuals(a, b), ols.univariate_residuals(b, a)
+    a_col, b_col, res_col = f'A{label_suffix}', f'B{label_suffix}', f'Residuals{label_suffix}'
+    
+    # Test A -> B
+    df_res_A_B = pd.DataFrame({a_col: df['A'], res_col: res_B_on_A})
+    fig_A_B = charts.create_scatter_plot(df_res_A_B, a_col, res_col, f'Test $A \\to B$: Residuals of B vs. A{title_suffix}')
+    
+    # Test B -> A
+    df_res_B_A = pd.DataFrame({b_col: df['B'], res_col: res_A_on_B})
+    fig_B_A = charts.create_scatter_plot(df_res_B_A, b_col, res_col, f'Test $B \\to A$: Residuals of A vs. B{title_suffix}')
+    return fig_A_B, fig_B_A
+
 # Use session state to store the results
 if 'pc_results' not in st.session_state:
     st.session_state.pc_results = None
 
 if st.button("Run PC Algorithm", type="primary", use_container_width=True):
     with st.spinner("Generating data and running algorithm..."):
-        # 1. Generate data
-        data = sim.generate_diamond_data(n_samples)
-        
-        # 2. Run Step 1
-        skeleton, sepset, log = pc_step_1_skeleton_with_logging(data, alpha)
-        
-        # 3. Run Step 2
-        pdag1 = pc_step_2_orient_colliders(skeleton, sepset)
-        
-        # 4. Run Step 3
-        pdag2 = pc_step_3_orient_remaining(pdag1.copy()) # Use a copy
+        # Generate data and run Steps 1-3
+        data, skeleton, sepset, pdag1, pdag2, log = cached_run_pc(n_samples, alpha, SEED, debug_mode)
         
         # Store results
         st.session_state.pc_results = {
@@ -457,7 +390,11 @@ if st.session_state.pc_results:
     with tab_log:
         st.subheader("Conditional Independence Test Log")
         if debug_mode:
-            st.code("\n".join(res["log"]), language="text")
+            log = res["log"]
+            if log is None:
+                # The run was made with logging disabled; replay it with the log on
+                log = cached_run_pc(n_samples, alpha, SEED, True)[5]
+            st.code(cached_format_ci_log(log), language="text")
         else:
             st.info("Enable 'Show CI Test Log (Debug Mode)' in the sidebar to see the detailed log.")
 
@@ -498,15 +435,8 @@ if st.button("Run Observational Check on $A$ and $B$", use_container_width=True,
     if st.session_state.pc_results:
         df_obs_amb = st.session_state.pc_results["data"]
         
-        # 2. Test A -> B
-        res_A_B = sim_indep.fit_and_get_residuals(df_obs_amb, 'A', 'B')
-        df_res_A_B = pd.DataFrame({'A': df_obs_amb['A'], 'Residuals': res_A_B})
-        fig_A_B = charts.create_scatter_plot(df_res_A_B, 'A', 'Residuals', 'Test $A \\to B$: Residuals of B vs. A')
-        
-        # 3. Test B -> A
-        res_B_A = sim_indep.fit_and_get_residuals(df_obs_amb, 'B', 'A')
-        df_res_B_A = pd.DataFrame({'B': df_obs_amb['B'], 'Residuals': res_B_A})
-        fig_B_A = charts.create_scatter_plot(df_res_B_A, 'B', 'Residuals', 'Test $B \\to A$: Residuals of A vs. B')
+        # 2. Test A -> B and B -> A
+        fig_A_B, fig_B_A = cached_residual_plots(df_obs_amb)
         
         st.session_state.obs_ambiguity = (fig_A_B, fig_B_A)
     else:
@@ -560,17 +490,10 @@ if 'int_ambiguity' not in st.session_state:
 
 if st.button("Perform Intervention: $do(A := \\text{Uniform}(3, 7))$", type="primary", use_container_width=True, key="int_check_btn"):
     # 1. Generate interventional data
-    df_int = sim.generate_diamond_interventional_data(n_samples=2000)
-    
-    # 2. Test A -> B (Correct Model)
-    res_A_B_int = sim_indep.fit_and_get_residuals(df_int, 'A', 'B')
-    df_res_A_B_int = pd.DataFrame({'A_int': df_int['A'], 'Residuals_int': res_A_B_int})
-    fig_A_B_int = charts.create_scatter_plot(df_res_A_B_int, 'A_int', 'Residuals_int', 'Test $A \\to B$: Residuals of B vs. A (Interventional)')
+    df_int = cached_generate_interventional_data(2000, SEED)
     
-    # 3. Test B -> A (Incorrect Model)
-    res_B_A_int = sim_indep.fit_and_get_residuals(df_int, 'B', 'A')
-    df_res_B_A_int = pd.DataFrame({'B_int': df_int['B'], 'Residuals_int': res_B_A_int})
-    fig_B_A_int = charts.create_scatter_plot(df_res_B_A_int, 'B_int', 'Residuals_int', 'Test $B \\to A$: Residuals of A vs. B (Interventional)')
+    # 2. Test A -> B (Correct Model) and B -> A (Incorrect Model)
+    fig_A_B_int, fig_B_A_int = cached_residual_plots(df_int, "_int", " (Interventional)")
     
     st.session_state.int_ambiguity = (fig_A_B_int, fig_B_A_int)
 
@@ -1,82 +1,10 @@
 import streamlit as st
 import pandas as pd
-import networkx as nx
-import pingouin as pg
 import graphviz
-from itertools import combinations
-from typing import Dict, Set, Tuple, List
 
 import src.simulations.fci_simulation as sim_fci
 import src.plotting.charts as charts
-from src.algorithms.pc_algorithm import pc_step_2_orient_colliders, pc_step_3_orient_remaining
-
-# LOCAL PC ALGORITHM WITH LOGGING (for this page only) 
-
-def _get_neighbors(graph: nx.Graph, node) -> Set:
-    """Helper to get the set of current neighbors for a node."""
-    return set(graph.neighbors(node))
-
-def _partial_correlation_test(data: pd.DataFrame, i: str, j: str, S: Set[str], alpha: float, log: List[str]) -> bool:
-    """Performs CI test and logs results."""
-    n_samples = len(data)
-    if n_samples < len(S) + 3:
-        log.append(f"SKIPPED: {i} _||_ {j} | {S} (n_samples too small)")
-        return False
-
-    try:
-        result = pg.partial_corr(data=data, x=i, y=j, covar=list(S) if S else None)
-        p_value = result['p-val'].iloc[0]
-        is_independent = p_value > alpha
-        verdict = "INDEPENDENT" if is_independent else "Dependent"
-        log.append(f"Test: {i} _||_ {j} | {S}?  p-val: {p_value:.4f} > {alpha}.  Verdict: {verdict}")
-        return is_independent
-    except Exception as e:
-        log.append(f"ERROR: {i} _||_ {j} | {S}. Error: {e}")
-        return False
-
-def _pc_step_1_with_logging(data: pd.DataFrame, alpha: float) -> Tuple[nx.Graph, Dict, List[str]]:
-    """Local PC skeleton function with logging."""
-    nodes = list(data.columns)
-    skeleton = nx.complete_graph(nodes)
-    sepset = {}
-    log = []
-    
-    k = 0
-    while True:
-        k_changed = False
-        log.append(f"--- Testing with conditioning set size k = {k} ---")
-        edges_to_remove = []
-        
-        for (i, j) in list(skeleton.edges()):
-            adj_i = _get_neighbors(skeleton, i) - {j}
-            adj_j = _get_neighbors(skeleton, j) - {i}
-            adj_set = adj_i if len(adj_i) <= len(adj_j) else adj_j
-            
-            if len(adj_set) >= k:
-                for S in combinations(adj_set, k):
-                    if _partial_correlation_test(data, i, j, set(S), alpha, log):
-                        edges_to_remove.append((i, j))
-                        sepset[(i, j)] = set(S)
-                        sepset[(j, i)] = set(S)
-                        k_changed = True
-                        log.append(f"REMOVING edge {i} -- {j} based on S = {S}")
-                        break
-        
-        skeleton.remove_edges_from(edges_to_remove)
-        k += 1
-        
-        if all(len(_get_neighbors(skeleton, n)) < k for n in nodes):
-            log.append(f"Stopping: No node has {k} neighbors left.")
-            break
-            
-    log.append("--- Skeleton search complete ---")
-    return skeleton, sepset, log
-
-st.set_page_config(
-    page_title="Hidden Confounding & FCI",
-    page_icon="👻",
-    layout="wide"
-)
+from src.algorithms.pc_algorithm import format_ci_log, run_pc
 
 st.title("👻 The Specter of Hidden Confounding")
 st.markdown(
@@ -114,30 +42,41 @@ st.markdown(
     """
 )
 
+st.sidebar.header("PC Algorithm Controls")
+alpha = st.sidebar.select_slider("Significance level (alpha)", options=[0.01, 0.05, 0.1], value=0.05)
+
+# A fixed seed keeps the cache keys stable, so repeat clicks are a cache lookup
+SEED = 1
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=8)
+def cached_run_pc(n_samples, alpha, seed):
+    data = sim_fci.generate_m_graph_data(n_samples=n_samples, seed=seed)
+    _, _, _, pdag_final, log = run_pc(data, alpha=alpha, log=[])
+    return pdag_final, log
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def cached_format_ci_log(log):
+    return format_ci_log(log)
+
 # Use session state to store results
 if 'fci_results' not in st.session_state:
     st.session_state.fci_results = None
 
 if st.button("Run PC Algorithm on Observed Data (A, B, C, D, E)", type="primary", use_container_width=True):
     with st.spinner("Generating confounded data and running PC algorithm..."):
-        # 1. Generate data (A, B, C, D, E are returned)
-        data = sim_fci.generate_m_graph_data(n_samples=2000)
-        
-        # 2. Run PC Algorithm on the observed data WITH LOGGING
-        skeleton, sepset, log = _pc_step_1_with_logging(data, alpha=0.05)
-        pdag1 = pc_step_2_orient_colliders(skeleton.copy(), sepset)
-        pdag_final = pc_step_3_orient_remaining(pdag1.copy())
+        # 1-2. Generate data (A, B, C, D, E) and run the PC Algorithm on it WITH LOGGING
+        pdag_final, log = cached_run_pc(2000, alpha, SEED)
         
-        # 3. Get the "oracle" graphs
-        true_graph_dot = sim_fci.get_m_graph_ground_truth_dot()
-        fci_graph_dot = sim_fci.get_fci_correct_output_dot()
-        pc_output_chart = charts.graphviz_from_nx(pdag_final, "PC Algorithm Output")
+        # 3. Get the "oracle" graphs (only the DOT source goes into session state)
+        true_graph_dot = sim_fci.get_m_graph_ground_truth_dot().source
+        fci_graph_dot = sim_fci.get_fci_correct_output_dot().source
+        pc_output_dot = charts.graphviz_from_nx(pdag_final, "PC Algorithm Output").source
 
         # Store results
         st.session_state.fci_results = {
-            "true_graph": true_graph_dot,
-            "pc_output": pc_output_chart,
-            "fci_output": fci_graph_dot,
+            "true_graph_dot": true_graph_dot,
+            "pc_output_dot": pc_output_dot,
+            "fci_output_dot": fci_graph_dot,
             "log": log
         }
 
@@ -154,7 +93,7 @@ if st.session_state.fci_results:
     
     with tab_truth:
         st.markdown("This is the *true* SCM that generated the data. The nodes $H_1$ and $H_2$ are **hidden**; the algorithm only sees $A, B, C, D, E$.")
-        st.graphviz_chart(res["true_graph"])
+        st.graphviz_chart(res["true_graph_dot"])
         with st.expander("Show Ground Truth SCM"):
             st.latex(r'''
                 \begin{aligned}
@@ -194,7 +133,7 @@ if st.session_state.fci_results:
             
     with tab_pc:
         st.markdown("This is the graph the **PC Algorithm** discovers. It assumes Causal Sufficiency, so it cannot represent the hidden confounders $H_1$ or $H_2$.")
-        st.graphviz_chart(res["pc_output"])
+        st.graphviz_chart(res["pc_output_dot"])
         
         with st.expander("📊 Analyzing PC's Mistake (A Step-by-Step Log Analysis)"):
             st.markdown(
@@ -315,7 +254,7 @@ if st.session_state.fci_results:
 
     with tab_fci:
         st.markdown("This is the **Partial Ancestral Graph (PAG)** that the **FCI Algorithm** would discover from the *exact same data*.")
-        st.graphviz_chart(res["fci_output"])
+        st.graphviz_chart(res["fci_output_dot"])
         
         with st.expander("🎯 Understanding FCI's Output (A Partial Ancestral Graph)"):
             st.markdown(
@@ -366,7 +305,7 @@ if st.session_state.fci_results:
     with tab_log:
         st.subheader("PC Algorithm Conditional Independence Test Log")
         st.markdown("This log shows every conditional independence test the PC algorithm performed. Look for the critical tests on $C, D, E$!")
-        st.code("\n".join(res["log"]), language="text")
+        st.code(cached_format_ci_log(res["log"]), language="text")
         
 else:
     st.info("Click the button to generate confounded data and run the PC algorithm.")
@@ -1,11 +1,5 @@
 import streamlit as st
 
-st.set_page_config(
-    page_title="Final Thoughts",
-    page_icon="🏁",
-    layout="wide"
-)
-
 st.title("🏁 Final Thoughts")
 
 st.markdown(
@@ -36,15 +30,11 @@ st.divider()
 
 st.header("Limitations and Assumptions")
 st.markdown(
-    """
+    r"""
     If I've learned one thing, it's that the tools we've explored
     are just the first step. They are incredibly powerful, but they
     are not magic. They all come with real-world limitations.
-    """
-)
 
-st.markdown(
-    r"""
     **The Limitations We've Built On:**
     
     * **The Causal Markov Property:** We've implicitly assumed that our
@@ -141,9 +131,10 @@ st.markdown(
     """
 )
 
-st.markdown("##### A New Example: Learning a Light Switch")
 st.markdown(
     """
+    ##### A New Example: Learning a Light Switch
+
     1.  **Child's First Model:** A child learns a simple, correct causal model: `Switch_Down -> Light_On`. This model has perfect predictive power.
     
     2.  **Falsifying Evidence:** The child encounters a "three-way switch" (two switches, one light). They press their switch down, but the light *stays off*.
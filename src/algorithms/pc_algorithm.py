@@ -1,167 +1,252 @@
+import math
+import numpy as np
 import pandas as pd
 import networkx as nx
-import pingouin as pg
-from itertools import combinations, permutations
-from typing import Dict, Set, Tuple
+from itertools import combinations
+from scipy.stats import norm
+from typing import Dict, List, Optional, Sequence, Tuple
 
-def _get_neighbors(graph: nx.Graph, node) -> Set:
-    """Helper to get the set of current neighbors for a node."""
-    return set(graph.neighbors(node))
+def _pair(a, b) -> Tuple:
+    """Canonical (smaller, larger) key for an unordered pair, as used by sepset dictionaries."""
+    return (a, b) if a < b else (b, a)
 
-def partial_correlation_test(data: pd.DataFrame, i: str, j: str, S: Set[str], alpha: float) -> bool:
+def _bits(mask: int):
+    """Yields the node IDs set in an adjacency bitmask, in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def _correlation_matrix(data: pd.DataFrame) -> Tuple[np.ndarray, int]:
+    """
+    Computes the sample correlation matrix once for all CI tests.
+
+    Returns:
+        Tuple containing:
+        - np.ndarray: The p x p correlation matrix, indexed by column position.
+        - int: The number of samples.
+    """
+    X = np.ascontiguousarray(data.to_numpy(dtype=np.float64, copy=False))
+    C = np.corrcoef(X, rowvar=False)
+    return C, X.shape[0]
+
+def _z_critical(alpha: float) -> float:
+    """Two-sided critical value of the Fisher-Z statistic for significance level alpha."""
+    return float(norm.ppf(1 - alpha / 2))
+
+def _p_value(z: float) -> float:
+    """Two-sided p-value of a Fisher-Z statistic; only needed for the debug log."""
+    return float(2 * norm.sf(z))
+
+def partial_correlation_test(C: np.ndarray, n: int, i: int, j: int, S: Sequence[int], z_crit: float) -> Tuple[bool, Optional[float]]:
     """
-    Performs a conditional independence test using partial correlation.
+    Performs a conditional independence test using partial correlation (Fisher-Z).
     
     Args:
-        data: The DataFrame.
-        i, j: The two variables to test.
-        S: The conditioning set.
-        alpha: The significance level.
+        C: The sample correlation matrix of the data.
+        n: The number of samples.
+        i, j: Indices of the two variables to test.
+        S: Indices of the conditioning set.
+        z_crit: The critical value for the significance level, from _z_critical(alpha).
 
     Returns:
-        bool: True if i and j are independent given S (p-value > alpha), False otherwise.
+        Tuple containing:
+        - bool: True if i and j are independent given S (p-value > alpha), False otherwise.
+        - float: The Fisher-Z statistic, or None if the test could not be performed.
     """
     # Handle the edge case where n_samples is too small for the test
-    n_samples = len(data)
-    if n_samples < len(S) + 3:
+    if n < len(S) + 4:
         # Not enough data to test; conservatively assume dependence
-        return False
+        return False, None
 
-    # Use pingouin to calculate partial correlation and p-value
-    # It correctly handles S=None or S=[] for order-0 correlation
-    try:
-        result = pg.partial_corr(data=data, x=i, y=j, covar=list(S) if S else None)
-        p_value = result['p-val'].iloc[0]
-        
-        # We cannot reject H0 (independence)
-        return p_value > alpha
-    except Exception as e:
-        # Handle potential numerical errors (e.g., singular matrix)
-        # Conservatively assume dependence
-        print(f"CI Test Error ({i}, {j} | {S}): {e}")
-        return False
+    if not S:
+        r = C[i, j]
+    elif len(S) == 1:
+        # Closed form for a single conditioning variable; no matrix inverse needed
+        k = S[0]
+        r_ik, r_jk = C[i, k], C[j, k]
+        denom = (1 - r_ik * r_ik) * (1 - r_jk * r_jk)
+        if denom <= 0:
+            # Degenerate (perfectly collinear); conservatively assume dependence
+            return False, None
+        r = (C[i, j] - r_ik * r_jk) / math.sqrt(denom)
+    else:
+        # Partial correlation from the inverse of the submatrix over {i, j} + S
+        nodes = [i, j, *S]
+        try:
+            P = np.linalg.inv(C[np.ix_(nodes, nodes)])
+        except np.linalg.LinAlgError:
+            # Singular matrix; conservatively assume dependence
+            return False, None
+        r = -P[0, 1] / math.sqrt(P[0, 0] * P[1, 1])
+
+    r = min(max(r, -0.999999), 0.999999)
+    z = math.sqrt(n - len(S) - 3) * abs(math.atanh(r))
 
+    # We cannot reject H0 (independence); same verdict as p-value > alpha
+    return z < z_crit, z
 
-def pc_step_1_skeleton(data: pd.DataFrame, alpha: float) -> Tuple[nx.Graph, Dict]:
+
+def _test_edge(C: np.ndarray, n: int, z_crit: float, i: int, j: int, ordered: List[int], k: int) -> Tuple[Optional[Tuple[int, ...]], List[Tuple]]:
     """
-    Executes Step 1 of the PC algorithm to find the graph skeleton.
-    
-    Args:
-        data: The observational data.
-        alpha: The significance level for CI tests.
-        
+    Searches the size-k subsets of ordered for a set separating i and j.
+    Under PC-stable each (i, j, S) is tested at most once, so nothing is memoized.
+
     Returns:
         Tuple containing:
-        - nx.Graph: The undirected graph skeleton.
-        - dict: The sepset dictionary.
+        - tuple: The first separating set found, or None.
+        - list: (S, is_independent, z) for every test performed, in order.
     """
-    nodes = list(data.columns)
-    skeleton = nx.complete_graph(nodes)
-    sepset = {}
-    
-    k = 0
-    while True:
-        k_changed = False
-        edges_to_remove = []
-        
-        for (i, j) in skeleton.edges():
-            # Correction: Use CURRENT neighbors (adj) for subset generation
-            adj_i = _get_neighbors(skeleton, i) - {j}
-            adj_j = _get_neighbors(skeleton, j) - {i}
-            
-            # Check neighbors of i
-            if len(adj_i) >= k:
-                for S in combinations(adj_i, k):
-                    if partial_correlation_test(data, i, j, set(S), alpha):
-                        edges_to_remove.append((i, j))
-                        sepset[(i, j)] = set(S)
-                        sepset[(j, i)] = set(S) # Store symmetric separating set
-                        k_changed = True
-                        break # Move to next edge
-                if (i, j) in edges_to_remove:
-                    continue # Already found separating set for this edge
-            
-            # Check neighbors of j (if not found for i)
-            if len(adj_j) >= k:
-                for S in combinations(adj_j, k):
-                    if partial_correlation_test(data, i, j, set(S), alpha):
-                        edges_to_remove.append((i, j))
-                        sepset[(i, j)] = set(S)
-                        sepset[(j, i)] = set(S)
-                        k_changed = True
-                        break # Move to next edge
-        
-        skeleton.remove_edges_from(edges_to_remove)
-        
-        if not k_changed:
-            break # No more edges were removed at this k, so we're done
-        
-        k += 1
-        
-    return skeleton, sepset
+    tests = []
+    for S in combinations(ordered, k):
+        is_independent, z = partial_correlation_test(C, n, i, j, S, z_crit)
+        tests.append((S, is_independent, z))
+        if is_independent:
+            return S, tests
+    return None, tests
+
 
-def pc_step_1_skeleton_with_logging(data: pd.DataFrame, alpha: float) -> tuple[nx.Graph, dict, list[str]]:
+def pc_step_1_skeleton_with_logging(data: pd.DataFrame, alpha: float, log: Optional[List[tuple]] = None) -> Tuple[nx.Graph, Dict, Optional[List[tuple]]]:
     """
     Executes Step 1 of the PC algorithm to find the graph skeleton.
     Returns the skeleton, sepset dictionary, and a debug log.
     
-    This is a standalone version with logging for the PC Algorithm Demo page.
-    
     Args:
         data: The observational data (DataFrame with variables as columns)
         alpha: The significance level for CI tests (typically 0.05)
+        log: List to append the debug log entries to, or None to skip recording them
         
     Returns:
         Tuple containing:
         - nx.Graph: The undirected graph skeleton
-        - Dict: The sepset dictionary {(i,j): Set of conditioning variables}
-        - List[str]: Debug log of all tests performed
+        - Dict: The sepset dictionary {_pair(i,j): frozenset of conditioning variables}
+        - List[tuple]: Debug log of all tests performed, as structured entries for
+          format_ci_log (None if log was None)
     """
     nodes = list(data.columns)
-    skeleton = nx.complete_graph(nodes)
+    C, n = _correlation_matrix(data)
+    p = len(nodes)
+    z_crit = _z_critical(alpha)
     sepset = {}
-    log = []
     
-    k = 0
+    # The search runs on integer node IDs (column positions in C), with the
+    # skeleton held as one adjacency bitmask per node; names are only looked
+    # up for the log and the returned graph/sepset.
+    
+    # k = 0: every marginal test at once from the correlation matrix, so only
+    # the dependent pairs ever enter the skeleton
+    if log is not None:
+        log.append(("LEVEL", 0))
+    adj = [0] * p
+    if n >= 4:
+        Z = np.abs(np.arctanh(np.clip(C, -0.999999, 0.999999))) * math.sqrt(n - 3)
+    for (i, j) in combinations(range(p), 2):
+        if n < 4:
+            if log is not None:
+                log.append(("SKIPPED", nodes[i], nodes[j], (), n))
+            adj[i] |= 1 << j
+            adj[j] |= 1 << i
+            continue
+        z = Z[i, j]
+        is_independent = z < z_crit
+        if log is not None:
+            log.append(("TEST", nodes[i], nodes[j], (), z, alpha, is_independent))
+        if is_independent:
+            sepset[(i, j)] = ()
+            if log is not None:
+                log.append(("REMOVE", nodes[i], nodes[j], ()))
+        else:
+            adj[i] |= 1 << j
+            adj[j] |= 1 << i
+    
+    k = 1
     while True:
-        k_changed = False
-        log.append(f"--- Testing with conditioning set size k = {k} ---")
+        # An edge needs k neighbors besides its other endpoint to be tested at level k
+        if max((mask.bit_count() for mask in adj), default=0) < k + 1:
+            if log is not None:
+                log.append(("STOP", k + 1))
+            break
+            
+        if log is not None:
+            log.append(("LEVEL", k))
         edges_to_remove = []
         
-        # Iterate over a copy of edges, as we modify the graph
-        for (i, j) in list(skeleton.edges()):
-            adj_i = _get_neighbors(skeleton, i) - {j}
-            adj_j = _get_neighbors(skeleton, j) - {i}
-            
-            found_separator = False
-            
-            # Use the smaller adjacency set for efficiency
-            adj_set = adj_i if len(adj_i) <= len(adj_j) else adj_j
-            
-            if len(adj_set) >= k:
-                for S in combinations(adj_set, k):
-                    if partial_correlation_test(data, i, j, set(S), alpha, log):
-                        edges_to_remove.append((i, j))
-                        sepset[(i, j)] = set(S)
-                        sepset[(j, i)] = set(S)
-                        k_changed = True
-                        found_separator = True
-                        log.append(f"REMOVING edge {i} -- {j} based on S = {S}")
-                        break
-            if found_separator:
-                continue
+        # Edges are only removed after the whole level, so every edge's test is independent
+        for i in range(p):
+            for j in _bits(adj[i] >> (i + 1) << (i + 1)):
+                adj_i = adj[i] & ~(1 << j)
+                adj_j = adj[j] & ~(1 << i)
+                
+                # Use the smaller adjacency set for efficiency; skip if it is too small
+                adj_set = adj_i if adj_i.bit_count() <= adj_j.bit_count() else adj_j
+                if adj_set.bit_count() < k:
+                    continue
+                
+                # Try likely separators first: shared neighbors, then low-degree nodes
+                common = adj_i & adj_j
+                ordered = sorted(_bits(adj_set), key=lambda v: (not common >> v & 1, adj[v].bit_count(), v))
+                separator, tests = _test_edge(C, n, z_crit, i, j, ordered, k)
+                
+                if log is not None:
+                    for S, is_independent, z in tests:
+                        S = tuple(nodes[s] for s in S)
+                        if z is None:
+                            log.append(("SKIPPED", nodes[i], nodes[j], S, n))
+                        else:
+                            log.append(("TEST", nodes[i], nodes[j], S, z, alpha, is_independent))
+                if separator is not None:
+                    edges_to_remove.append((i, j))
+                    sepset[(i, j)] = separator
+                    if log is not None:
+                        log.append(("REMOVE", nodes[i], nodes[j], tuple(nodes[s] for s in separator)))
         
-        skeleton.remove_edges_from(edges_to_remove)
-            
+        for (i, j) in edges_to_remove:
+            adj[i] &= ~(1 << j)
+            adj[j] &= ~(1 << i)
         k += 1
-        
-        # Check if we can even form a conditioning set of size k
-        if all(len(_get_neighbors(skeleton, n)) < k for n in nodes):
-            log.append(f"Stopping: No node has {k} neighbors left.")
-            break
             
-    log.append("--- Skeleton search complete ---")
-    return skeleton, sepset, log
+    if log is not None:
+        log.append(("DONE",))
+    
+    # Back to a named graph for the caller
+    skeleton = nx.Graph()
+    skeleton.add_nodes_from(nodes)
+    skeleton.add_edges_from((nodes[i], nodes[j]) for i in range(p) for j in _bits(adj[i]) if i < j)
+    named_sepset = {
+        _pair(nodes[i], nodes[j]): frozenset(nodes[s] for s in S)
+        for (i, j), S in sepset.items()
+    }
+    return skeleton, named_sepset, log
+
+def _format_set(S: Tuple[str, ...]) -> str:
+    """Formats a conditioning set like a Python set literal, in a stable order."""
+    return "{" + ", ".join(map(repr, S)) + "}" if S else "set()"
+
+def format_ci_log(log: List[tuple]) -> str:
+    """
+    Renders the structured entries recorded by pc_step_1_skeleton_with_logging as text.
+    Formatting (and the p-value computation) is deferred until the log is actually shown.
+    """
+    lines = []
+    for entry in log:
+        kind = entry[0]
+        if kind == "LEVEL":
+            lines.append(f"--- Testing with conditioning set size k = {entry[1]} ---")
+        elif kind == "TEST":
+            _, i, j, S, z, alpha, is_independent = entry
+            verdict = "INDEPENDENT" if is_independent else "Dependent"
+            lines.append(f"Test: {i} _||_ {j} | {_format_set(S)}?  p-val: {_p_value(z):.4f} > {alpha}.  Verdict: {verdict}")
+        elif kind == "SKIPPED":
+            _, i, j, S, n = entry
+            lines.append(f"SKIPPED: {i} _||_ {j} | {_format_set(S)} (n_samples={n} is too small for |S|={len(S)})")
+        elif kind == "REMOVE":
+            _, i, j, S = entry
+            lines.append(f"REMOVING edge {i} -- {j} based on S = {S}")
+        elif kind == "STOP":
+            lines.append(f"Stopping: No node has {entry[1]} neighbors left.")
+        elif kind == "DONE":
+            lines.append("--- Skeleton search complete ---")
+    return "\n".join(lines)
 
 def pc_step_2_orient_colliders(skeleton: nx.Graph, sepset: Dict) -> nx.DiGraph:
     """
@@ -169,35 +254,39 @@ def pc_step_2_orient_colliders(skeleton: nx.Graph, sepset: Dict) -> nx.DiGraph:
     
     Args:
         skeleton: The undirected skeleton from Step 1.
-        sepset: The separating set dictionary from Step 1.
+        sepset: The separating set dictionary from Step 1, keyed by _pair(i, j).
         
     Returns:
         nx.DiGraph: A partially directed graph (PDAG) containing oriented colliders.
     """
     pdag = nx.DiGraph(skeleton) # Start with all edges as bi-directional
     
-    for k in skeleton.nodes():
-        # Find all uncoupled pairs (i, j) that are neighbors of k
-        neighbors_k = _get_neighbors(skeleton, k)
-        for (i, j) in combinations(neighbors_k, 2):
-            # Check if i and j are uncoupled (not adjacent)
-            if not skeleton.has_edge(i, j):
-                # This is a v-structure i - k - j
-                # Now check if k is in the separating set of (i, j)
-                
-                # Check sepset. Use get() to handle cases where (i,j) had no sepset (which shouldn't happen if not adj)
-                sep = sepset.get((i, j)) 
-                
-                if sep is None or k not in sep:
-                    # k is NOT in sepset(i, j), so orient as collider i -> k <- j
-                    # Remove the k -> i and k -> j edges from the DiGraph
-                    if pdag.has_edge(k, i): pdag.remove_edge(k, i)
-                    if pdag.has_edge(k, j): pdag.remove_edge(k, j)
+    nodes = list(skeleton.nodes())
+    A = nx.to_numpy_array(skeleton, nodelist=nodes, dtype=bool)
+    
+    # Uncoupled pairs (i, j) with at least one common neighbor: a length-2 path
+    # exists between them but no edge. One matrix product finds them all.
+    A_int = A.astype(np.int32)
+    uncoupled = (A_int @ A_int > 0) & ~A
+    np.fill_diagonal(uncoupled, False)
+    
+    for i, j in np.argwhere(np.triu(uncoupled)):
+        # Check sepset. Use get() to handle cases where (i,j) had no sepset (which shouldn't happen if not adj)
+        sep = sepset.get(_pair(nodes[i], nodes[j]))
+        
+        # Every common neighbor k gives a v-structure i - k - j
+        for k in np.flatnonzero(A[i] & A[j]):
+            k_node = nodes[k]
+            if sep is None or k_node not in sep:
+                # k is NOT in sepset(i, j), so orient as collider i -> k <- j
+                # Remove the k -> i and k -> j edges from the DiGraph
+                if pdag.has_edge(k_node, nodes[i]): pdag.remove_edge(k_node, nodes[i])
+                if pdag.has_edge(k_node, nodes[j]): pdag.remove_edge(k_node, nodes[j])
                     
     return pdag
 
 
-def pc_step_3_orient_remaining(pdag: nx.DiGraph) -> nx.DiGraph:
+def pc_step_3_orient_remaining(pdag: nx.DiGraph, *, copy: bool = True) -> nx.DiGraph:
     """
     Executes Step 3 of the PC algorithm, applying Meek's 4 orientation rules
     iteratively until no more edges can be oriented.
@@ -210,132 +299,103 @@ def pc_step_3_orient_remaining(pdag: nx.DiGraph) -> nx.DiGraph:
     
     Args:
         pdag: The partially directed graph from Step 2.
+        copy: Orient a copy of pdag. Pass False to orient it in place when the
+            Step 2 graph is not needed afterwards.
         
     Returns:
         nx.DiGraph: The final CPDAG.
     """
-    
-    def _has_undirected_edge(G, u, v):
-        """Check if u-v is undirected (both u->v and v->u exist)"""
-        return G.has_edge(u, v) and G.has_edge(v, u)
+    if copy:
+        pdag = pdag.copy()
 
-    def _has_directed_edge(G, u, v):
-        """Check if u->v is directed (u->v exists but v->u does not)"""
-        return G.has_edge(u, v) and not G.has_edge(v, u)
+    # Neighbour bitmasks per node ID, kept in sync as edges get oriented.
+    # Adjacency itself never changes in Step 3, only the direction of edges.
+    nodes = list(pdag.nodes())
+    node_id = {v: b for b, v in enumerate(nodes)}
+    undirected = [0] * len(nodes)
+    directed_in = [0] * len(nodes)
+    directed_out = [0] * len(nodes)
+    for u, v in pdag.edges():
+        a, b = node_id[u], node_id[v]
+        if pdag.has_edge(v, u):
+            undirected[a] |= 1 << b
+        else:
+            directed_out[a] |= 1 << b
+            directed_in[b] |= 1 << a
+    adjacent = [u | i | o for u, i, o in zip(undirected, directed_in, directed_out)]
 
-    def _is_adjacent(G, u, v):
-        """Check if u and v are adjacent (any edge between them)"""
-        return G.has_edge(u, v) or G.has_edge(v, u)
+    def _orient(i, j):
+        """Turn i-j into i->j"""
+        pdag.remove_edge(nodes[j], nodes[i])
+        undirected[i] &= ~(1 << j)
+        undirected[j] &= ~(1 << i)
+        directed_out[i] |= 1 << j
+        directed_in[j] |= 1 << i
 
-    while True:
-        made_change = False
-        
+    def _r1(i, j):
         # Rule R1: Orient i-j into i->j if there is k->i and k,j not adjacent
         # Pattern: k -> i - j with k and j nonadjacent
         # Reason: Avoid creating v-structure k -> i <- j
-        for (i, j) in list(pdag.edges()):
-            if not _has_undirected_edge(pdag, i, j):
-                continue
-            
-            # Find k such that k -> i
-            for k in pdag.nodes():
-                if k == i or k == j:
-                    continue
-                if _has_directed_edge(pdag, k, i) and not _is_adjacent(pdag, k, j):
-                    # Orient i -> j
-                    pdag.remove_edge(j, i)
-                    made_change = True
-                    break
-            if made_change:
-                break
-        if made_change:
-            continue
+        return bool(directed_in[i] & ~adjacent[j] & ~(1 << j))
 
+    def _r2(i, j):
         # Rule R2: Orient i-j into i->j if there is a chain i->k->j
-        # Pattern: i -> k -> j with i-j undirected
         # Reason: Avoid creating a cycle
-        for (i, j) in list(pdag.edges()):
-            if not _has_undirected_edge(pdag, i, j):
-                continue
-            
-            # Find k such that i -> k -> j
-            for k in pdag.nodes():
-                if k == i or k == j:
-                    continue
-                if _has_directed_edge(pdag, i, k) and _has_directed_edge(pdag, k, j):
-                    # Orient i -> j
-                    pdag.remove_edge(j, i)
-                    made_change = True
-                    break
-            if made_change:
-                break
-        if made_change:
-            continue
+        return bool(directed_out[i] & directed_in[j])
 
+    def _r3(i, j):
         # Rule R3: Orient i-j into i->j if there are two chains i-k->j and i-l->j
         # where k and l are nonadjacent
-        # Pattern: i - k -> j and i - l -> j with k,l nonadjacent
         # Reason: Avoid creating v-structure k -> j <- l
-        for (i, j) in list(pdag.edges()):
-            if not _has_undirected_edge(pdag, i, j):
-                continue
-            
-            # Find all k such that i - k -> j
-            candidates = []
-            for k in pdag.nodes():
-                if k == i or k == j:
-                    continue
-                if _has_undirected_edge(pdag, i, k) and _has_directed_edge(pdag, k, j):
-                    candidates.append(k)
-            
-            # Check if any two candidates are nonadjacent
-            if len(candidates) >= 2:
-                for k, l in combinations(candidates, 2):
-                    if not _is_adjacent(pdag, k, l):
-                        # Orient i -> j
-                        pdag.remove_edge(j, i)
-                        made_change = True
-                        break
-                if made_change:
-                    break
-        if made_change:
-            continue
+        candidates = undirected[i] & directed_in[j]
+        return any(candidates & ~adjacent[k] & ~(1 << k) for k in _bits(candidates))
 
+    def _r4(i, j):
         # Rule R4: Orient i-j into i->j if there are chains i-k->l and k->l->j
         # where k and j are nonadjacent
-        # Pattern: discriminating path i - k -> l -> j with k,j nonadjacent
         # Reason: Complex case for discriminating paths
-        for (i, j) in list(pdag.edges()):
-            if not _has_undirected_edge(pdag, i, j):
-                continue
-            
-            # Find k,l such that i - k -> l -> j with k,j nonadjacent
-            for k in pdag.nodes():
-                if k == i or k == j:
-                    continue
-                if not _has_undirected_edge(pdag, i, k):
-                    continue
-                if _is_adjacent(pdag, k, j):
-                    continue  # k and j must be nonadjacent
-                
-                # Now find l such that k -> l -> j
-                for l in pdag.nodes():
-                    if l == i or l == j or l == k:
-                        continue
-                    if _has_directed_edge(pdag, k, l) and _has_directed_edge(pdag, l, j):
-                        # Orient i -> j
-                        pdag.remove_edge(j, i)
-                        made_change = True
-                        break
-                if made_change:
-                    break
-            if made_change:
-                break
-        if made_change:
-            continue
+        chains_into_j = directed_in[j] & ~(1 << i)
+        return any(
+            directed_out[k] & chains_into_j
+            for k in _bits(undirected[i] & ~adjacent[j] & ~(1 << j))
+        )
 
-        # If no changes were made in this full pass, we are done
+    # One pass tries every rule on every undirected edge (both directions) and
+    # orients as it goes; only a pass that changed something is repeated.
+    while True:
+        made_change = False
+        for i in range(len(nodes)):
+            for j in _bits(undirected[i]):
+                if not undirected[i] >> j & 1:
+                    continue  # Oriented earlier in this pass
+                if _r1(i, j) or _r2(i, j) or _r3(i, j) or _r4(i, j):
+                    _orient(i, j)
+                    made_change = True
         if not made_change:
             break
             
     return pdag
+
+
+def run_pc(data: pd.DataFrame, alpha: float, log: Optional[List[tuple]] = None) -> Tuple[nx.Graph, Dict, nx.DiGraph, nx.DiGraph, Optional[List[tuple]]]:
+    """
+    Runs all three phases of the PC algorithm in one call.
+    
+    Args:
+        data: The observational data (DataFrame with variables as columns)
+        alpha: The significance level for CI tests
+        log: List to append the Step 1 debug log to, or None to skip it
+        
+    Returns:
+        Tuple containing:
+        - nx.Graph: The skeleton from Step 1
+        - Dict: The sepset dictionary from Step 1
+        - nx.DiGraph: The PDAG with colliders oriented (Step 2)
+        - nx.DiGraph: The final CPDAG (Step 3)
+        - List[tuple]: The Step 1 debug log, as structured entries for format_ci_log (None if log was None)
+    """
+    skeleton, sepset, log = pc_step_1_skeleton_with_logging(data, alpha, log=log)
+    pdag1 = pc_step_2_orient_colliders(skeleton, sepset)
+    # Step 3 orients a copy, so the Step 2 graph stays intact
+    pdag2 = pc_step_3_orient_remaining(pdag1)
+    return skeleton, sepset, pdag1, pdag2, log
@@ -1,19 +1,37 @@
 # src/plotting/charts.py
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 from plotly.graph_objects import Figure
 import plotly.graph_objects as go
-import plotly.figure_factory as ff
 
 import networkx as nx
 import graphviz 
 
+# plotly.express and scipy.stats are imported inside the functions that use
+# them, so importing this module for the graph_objects or graphviz helpers
+# does not pay for either.
+
+# Shared layout of the overlaid density plots
+_DENSITY_LAYOUT = dict(
+    title_x=0.5,
+    legend=dict(x=0.05, y=0.95),
+    plot_bgcolor='white',
+    xaxis=dict(gridcolor='lightgrey'),
+    yaxis=dict(gridcolor='lightgrey')
+)
+
+def _drop_nan(values) -> np.ndarray:
+    # Accepts a pd.Series or a bare np.ndarray alike.
+    values = np.asarray(values, dtype=float)
+    return values[~np.isnan(values)]
+
 def create_scatter_plot(
     df: pd.DataFrame, 
     x_col: str, 
     y_col: str, 
-    title: str
+    title: str,
+    render_mode: str = "webgl"
 ) -> Figure:
     """
     Creates an interactive scatter plot with a regression trendline.
@@ -23,19 +41,57 @@ def create_scatter_plot(
         x_col (str): The name of the column for the x-axis.
         y_col (str): The name of the column for the y-axis.
         title (str): The title of the chart.
+        render_mode (str): "webgl" (Scattergl, drawn on the GPU) or "svg" for
+            crisp static exports of small plots.
         
     Returns:
         Figure: A Plotly Figure object.
     """
-    fig = px.scatter(
-        df,
-        x=x_col,
-        y=y_col,
-        title=title,
-        trendline="ols", # Adds an Ordinary Least Squares regression line
-        trendline_color_override="red"
+    return create_scatter_plot_xy(df[x_col], df[y_col], x_col, y_col, title, render_mode=render_mode)
+
+
+def create_scatter_plot_xy(
+    x: np.ndarray, 
+    y: np.ndarray, 
+    x_label: str, 
+    y_label: str, 
+    title: str,
+    render_mode: str = "webgl"
+) -> go.Figure:
+    """
+    Creates a scatter plot with a red OLS trendline straight from two arrays,
+    built from graph_objects without building a DataFrame or going through
+    plotly.express (whose trendline="ols" also imports statsmodels).
+    
+    Args:
+        x (np.ndarray): The values for the x-axis.
+        y (np.ndarray): The values for the y-axis.
+        x_label (str): The label for the x-axis.
+        y_label (str): The label for the y-axis.
+        title (str): The title of the chart.
+        render_mode (str): "webgl" (Scattergl) or "svg" (Scatter).
+        
+    Returns:
+        go.Figure: A Plotly Figure object.
+    """
+    scatter = go.Scattergl if render_mode == "webgl" else go.Scatter
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Fit the trendline on complete pairs only, like px does
+    finite = np.isfinite(x) & np.isfinite(y)
+    slope, intercept = np.polyfit(x[finite], y[finite], 1)
+    x_line = np.array([x[finite].min(), x[finite].max()])
+    
+    fig = go.Figure([
+        scatter(x=x, y=y, mode='markers', showlegend=False),
+        scatter(x=x_line, y=slope * x_line + intercept, mode='lines', line=dict(color='red'), showlegend=False)
+    ])
+    fig.update_layout(
+        title_text=title,
+        title_x=0.5, # Center the title
+        xaxis_title=x_label,
+        yaxis_title=y_label
     )
-    fig.update_layout(title_x=0.5) # Center the title
     return fig
 
 
@@ -57,6 +113,7 @@ def create_histogram(
     Returns:
         Figure: A Plotly Figure object.
     """
+    import plotly.express as px
     fig = px.histogram(
         df,
         x=col_name,
@@ -71,7 +128,8 @@ def create_overlaid_density_plot(
     data_series2: pd.Series, 
     label1: str, 
     label2: str, 
-    title: str
+    title: str,
+    dropna: bool = True
 ) -> go.Figure:
     """
     Creates an interactive, overlaid density plot for two data series.
@@ -82,28 +140,14 @@ def create_overlaid_density_plot(
         label1 (str): The name for the first data series.
         label2 (str): The name for the second data series.
         title (str): The title of the chart.
+        dropna (bool): Drop NaNs from the series first (see `update_density_template`).
         
     Returns:
         go.Figure: A Plotly Figure object.
     """
-    fig = ff.create_distplot(
-        [data_series1.dropna(), data_series2.dropna()],
-        [label1, label2],
-        show_hist=False,
-        show_rug=False,
-        colors=['#1f77b4', '#ff7f0e'] 
-    )
-    
-    fig.update_layout(
-        title_text=title,
-        title_x=0.5,
-        legend=dict(x=0.05, y=0.95),
-        plot_bgcolor='white',
-        xaxis=dict(gridcolor='lightgrey'),
-        yaxis=dict(gridcolor='lightgrey')
-    )
-    
-    return fig
+    # Two KDE line traces; no figure_factory histogram/rug machinery
+    fig = create_density_template([label1, label2], title)
+    return update_density_template(fig, data_series1, data_series2, dropna=dropna)
 
 def create_comparison_density_plot(
     data_before: pd.Series, 
@@ -111,44 +155,134 @@ def create_comparison_density_plot(
     label_before: str, 
     label_after: str, 
     title: str,
-    color: str
+    color: str,
+    dropna: bool = True
 ) -> go.Figure:
     """
     Creates an overlaid density plot to compare a distribution before and after an event.
     
     Args:
-        data_before (pd.Series): The original data series.
-        data_after (pd.Series): The data series after a change.
+        data_before (pd.Series | np.ndarray): The original data series.
+        data_after (pd.Series | np.ndarray): The data series after a change.
         label_before (str): Legend label for the original data.
         label_after (str): Legend label for the new data.
         title (str): The title of the chart.
         color (str): The hex or named color to use for both plots.
+        dropna (bool): Drop NaNs from the series first (see `update_density_template`).
         
     Returns:
         go.Figure: A Plotly Figure object.
     """
-    # Create the distplot with the same color for both traces
-    fig = ff.create_distplot(
-        [data_before.dropna(), data_after.dropna()],
-        [label_before, label_after],
-        show_hist=False,
-        show_rug=False,
-        colors=[color, color]
-    )
-    
-    # Manually set the line styles: dashed for 'before', solid for 'after'
-    fig.data[0].line.dash = 'dash'
-    fig.data[1].line.dash = 'solid'
+    # Same color for both curves: dashed for 'before', solid for 'after'
+    fig = create_density_template([label_before, label_after], title, colors=[color, color], dashes=['dash', 'solid'])
+    return update_density_template(fig, data_before, data_after, dropna=dropna)
+
+def create_scatter_template(
+    x_label: str, 
+    y_label: str, 
+    title: str
+) -> go.Figure:
+    """
+    Creates an empty scatter plot skeleton (markers plus a red OLS trendline).
+    The layout is built once; fill in the data with `update_scatter_template`.
     
+    Args:
+        x_label (str): The label for the x-axis.
+        y_label (str): The label for the y-axis.
+        title (str): The title of the chart.
+        
+    Returns:
+        go.Figure: A Plotly Figure object with two empty traces.
+    """
+    fig = go.Figure()
+    fig.add_scatter(mode='markers', name='Data', showlegend=False)
+    fig.add_scatter(mode='lines', name='OLS trendline', line=dict(color='red'), showlegend=False)
     fig.update_layout(
         title_text=title,
-        title_x=0.5,
-        legend=dict(x=0.05, y=0.95),
-        plot_bgcolor='white',
-        xaxis=dict(gridcolor='lightgrey'),
-        yaxis=dict(gridcolor='lightgrey')
+        title_x=0.5, # Center the title
+        xaxis_title=x_label,
+        yaxis_title=y_label
     )
+    return fig
+
+
+def update_scatter_template(fig: go.Figure, x: pd.Series, y: pd.Series) -> go.Figure:
+    """
+    Replaces the data of a figure from `create_scatter_template` in place
+    and refits the OLS trendline.
+    
+    Args:
+        fig (go.Figure): The figure returned by `create_scatter_template`.
+        x (pd.Series): The values for the x-axis.
+        y (pd.Series): The values for the y-axis.
+        
+    Returns:
+        go.Figure: The same Figure object, updated.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    slope, intercept = np.polyfit(x, y, 1)
+    x_line = np.array([x.min(), x.max()])
     
+    with fig.batch_update():
+        fig.data[0].x = x
+        fig.data[0].y = y
+        fig.data[1].x = x_line
+        fig.data[1].y = slope * x_line + intercept
+    return fig
+
+
+def create_density_template(
+    labels: list, 
+    title: str, 
+    colors: tuple = ('#1f77b4', '#ff7f0e'),
+    dashes: tuple = ('solid', 'solid')
+) -> go.Figure:
+    """
+    Creates an empty overlaid density plot skeleton with one line per label
+    (the figure behind the density plot helpers above). Fill in the data with
+    `update_density_template`.
+    
+    Args:
+        labels (list): The legend names, one per density curve.
+        title (str): The title of the chart.
+        colors (tuple): The line colors, one per density curve.
+        dashes (tuple): The line dash styles, one per density curve.
+        
+    Returns:
+        go.Figure: A Plotly Figure object with one empty trace per label.
+    """
+    fig = go.Figure()
+    for label, color, dash in zip(labels, colors, dashes):
+        fig.add_scatter(mode='lines', name=label, line=dict(color=color, dash=dash))
+    
+    fig.update_layout(**_DENSITY_LAYOUT, title_text=title)
+    return fig
+
+
+def update_density_template(fig: go.Figure, *data_series: pd.Series, dropna: bool = True) -> go.Figure:
+    """
+    Replaces the curves of a figure from `create_density_template` in place
+    with a Gaussian KDE of each data series, on a 500-point grid spanning
+    that series (the grid plotly's ff.create_distplot uses).
+    
+    Args:
+        fig (go.Figure): The figure returned by `create_density_template`.
+        *data_series (pd.Series | np.ndarray): One data series per trace, in trace order.
+        dropna (bool): Drop NaNs first. Callers passing simulation output,
+            which never has any, can turn this off to skip the copy.
+        
+    Returns:
+        go.Figure: The same Figure object, updated.
+    """
+    from scipy.stats import gaussian_kde
+    
+    with fig.batch_update():
+        for trace, series in zip(fig.data, data_series):
+            values = _drop_nan(series) if dropna else np.asarray(series, dtype=float)
+            grid = np.linspace(values.min(), values.max(), 500, endpoint=False)
+            trace.x = grid
+            trace.y = gaussian_kde(values)(grid)
     return fig
 
 def create_colored_scatter_plot(
@@ -156,28 +290,31 @@ def create_colored_scatter_plot(
     x_col: str, 
     y_col: str, 
     color_col: str,
-    title: str
+    title: str,
+    render_mode: str = "webgl"
 ) -> Figure:
     """
     Creates an interactive scatter plot where points are colored by a discrete category.
+    Pass render_mode="svg" to opt out of WebGL, as in `create_scatter_plot`.
     """
-    # Create a copy to avoid modifying the original DataFrame
-    plot_df = df.copy()
+    scatter = go.Scattergl if render_mode == "webgl" else go.Scatter
+    groups = df[color_col].to_numpy()
+    x = df[x_col].to_numpy()
+    y = df[y_col].to_numpy()
     
-    plot_df[color_col] = plot_df[color_col].astype(str)
-    
-    fig = px.scatter(
-        plot_df,
-        x=x_col,
-        y=y_col,
-        color=color_col,
-        title=title,
-        color_discrete_map={'0': '#1f77b4', '1': '#d62728'}, 
-        labels={color_col: 'Holiday Season'}
+    # One trace per 0/1 category, masked straight from the arrays
+    fig = go.Figure()
+    for value, color, name in [(0, '#1f77b4', 'No'), (1, '#d62728', 'Yes')]:
+        mask = groups == value
+        if mask.any():
+            fig.add_trace(scatter(x=x[mask], y=y[mask], mode='markers', name=name, marker=dict(color=color)))
+    fig.update_layout(
+        title_text=title,
+        title_x=0.5,
+        xaxis_title=x_col,
+        yaxis_title=y_col,
+        legend_title_text='Holiday Season'
     )
-    fig.update_layout(title_x=0.5) 
-    # Update legend names
-    fig.for_each_trace(lambda t: t.update(name = {'0': 'No', '1': 'Yes'}[t.name]))
     return fig
 
 def graphviz_from_nx(graph: nx.Graph, title: str) -> graphviz.Digraph:
@@ -197,11 +334,16 @@ def graphviz_from_nx(graph: nx.Graph, title: str) -> graphviz.Digraph:
 
     if isinstance(graph, nx.DiGraph):
         # Handle PDAGs (nx.DiGraph where i-j means j->i and i->j)
+        succ = graph.succ
+        drawn = set()
         for u, v in graph.edges():
-            if graph.has_edge(v, u):
-                # It's an undirected edge
-                if u < v: # Only draw once
-                    dot.edge(str(u), str(v), dir='none', color='gray')
+            if u in succ[v] and u != v:
+                # It's an undirected edge; draw it once, from whichever
+                # direction comes first (works for any node labels)
+                if (v, u) in drawn:
+                    continue
+                drawn.add((u, v))
+                dot.edge(str(u), str(v), dir='none', color='gray')
             else:
                 # It's a directed edge
                 dot.edge(str(u), str(v), dir='forward', color='black')
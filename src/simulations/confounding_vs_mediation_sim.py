@@ -3,7 +3,9 @@
 import pandas as pd
 import numpy as np
 
-def generate_confounding_data(n_samples: int = 500) -> pd.DataFrame:
+from src.utils import ols
+
+def generate_confounding_data(n_samples: int = 500, seed: int = None) -> pd.DataFrame:
     """
     Generates data for a confounding scenario: Z -> X and Z -> Y.
     
@@ -11,29 +13,36 @@ def generate_confounding_data(n_samples: int = 500) -> pd.DataFrame:
     Z (Holiday_Season) := Bernoulli(0.2)
     X (Ad_Spend)       := 20*Z + N_X
     Y (Sales)          := 50*Z + 2*X + N_Y
+    
+    Pass `seed` for a reproducible draw.
     """
-    # Z is a confounder (e.g., 1 if holiday season, 0 otherwise)
-    z_holiday_season = np.random.binomial(1, 0.2, n_samples)
+    rng = np.random.default_rng(seed)
+    
+    # Z is a confounder (e.g., 1 if holiday season, 0 otherwise); a 0/1 flag
+    # needs one byte, not eight
+    z_holiday_season = rng.binomial(1, 0.2, n_samples).astype(np.int8)
     
     # Noise terms
-    n_x = np.random.normal(5, 2, n_samples)
-    n_y = np.random.normal(50, 5, n_samples)
+    n_x = rng.normal(5, 2, n_samples)
+    n_y = rng.normal(50, 5, n_samples)
+    
+    # The float columns are written into the rows of one preallocated block
+    out = np.empty((2, n_samples))
+    x_ad_spend, y_sales = out
     
     # X (Ad Spend) is influenced by the holiday season
-    x_ad_spend = 20 * z_holiday_season + n_x
+    x_ad_spend[:] = 20 * z_holiday_season + n_x
     
     # Y (Sales) is strongly influenced by the holiday season and weakly by ad spend
-    y_sales = 50 * z_holiday_season + 2 * x_ad_spend + n_y
+    y_sales[:] = 50 * z_holiday_season + 2 * x_ad_spend + n_y
     
-    df = pd.DataFrame({
-        'Ad_Spend': x_ad_spend,
-        'Sales': y_sales,
-        'Holiday_Season': z_holiday_season
-    })
+    df = pd.DataFrame(out.T, columns=['Ad_Spend', 'Sales'], copy=False)
+    # Holiday_Season stays an int8 0/1 column (its own block)
+    df['Holiday_Season'] = z_holiday_season
     return df
 
 
-def generate_mediation_data(n_samples: int = 500) -> pd.DataFrame:
+def generate_mediation_data(n_samples: int = 500, seed: int = None) -> pd.DataFrame:
     """
     Generates data for a mediation scenario: X -> Z -> Y.
     
@@ -41,24 +50,42 @@ def generate_mediation_data(n_samples: int = 500) -> pd.DataFrame:
     X (Ad_Spend)       := N_X
     Z (Website_Clicks) := 10*X + N_Z
     Y (Sales)          := 5*Z + N_Y
+    
+    Pass `seed` for a reproducible draw.
     """
+    rng = np.random.default_rng(seed)
+    
     # Noise terms
-    n_x = np.random.uniform(1, 10, n_samples)
-    n_z = np.random.normal(10, 5, n_samples)
-    n_y = np.random.normal(20, 10, n_samples)
+    n_x = rng.uniform(1, 10, n_samples)
+    n_z = rng.normal(10, 5, n_samples)
+    n_y = rng.normal(20, 10, n_samples)
+    
+    # All three columns are written into the rows of one preallocated block
+    out = np.empty((3, n_samples))
+    x_ad_spend, z_website_clicks, y_sales = out
     
     # X (Ad Spend) is the initial cause
-    x_ad_spend = n_x
+    x_ad_spend[:] = n_x
     
     # Z (Website Clicks) is caused by Ad Spend
-    z_website_clicks = 10 * x_ad_spend + n_z
+    z_website_clicks[:] = 10 * x_ad_spend + n_z
     
     # Y (Sales) is caused by Website Clicks
-    y_sales = 5 * z_website_clicks + n_y
-    
-    df = pd.DataFrame({
-        'Ad_Spend': x_ad_spend,
-        'Website_Clicks': z_website_clicks,
-        'Sales': y_sales
-    })
-    return df
\ No newline at end of file
+    y_sales[:] = 5 * z_website_clicks + n_y
+    
+    df = pd.DataFrame(out.T, columns=['Ad_Spend', 'Website_Clicks', 'Sales'], copy=False)
+    return df
+
+
+def fit_ols(df: pd.DataFrame, target: str, regressors: list) -> dict:
+    """
+    Fits target ~ regressors (plus an intercept) by ordinary least squares.
+    
+    Returns:
+        dict: The coefficients keyed by regressor name, plus 'Intercept',
+              matching the keys of a statsmodels formula fit's `params`.
+    """
+    y = df[target].to_numpy(dtype=float)
+    design = np.column_stack([np.ones(len(df))] + [df[col].to_numpy(dtype=float) for col in regressors])
+    beta = ols.fit_ols(design, y)
+    return dict(zip(['Intercept', *regressors], beta))
@@ -1,25 +1,68 @@
-def solve_for_nb(T: int, B: int) -> int:
+import numpy as np
+
+
+def _solve_for_nb(T, B):
     """
     Solves for the exogenous noise N_B given the observed T and B.
-    This is the 'Abduction' step.
-    
+    This is the 'Abduction' step. Works elementwise on arrays as well as scalars.
+
     SCM equation for B: B = T * N_B + (1-T) * (1-N_B)
+
+    If T=1 the equation simplifies to B = N_B, and if T=0 to B = 1 - N_B,
+    so N_B = T * B + (1-T) * (1-B): the same XNOR form as the SCM itself.
     """
-    if T == 1:
-        # If T=1, equation simplifies to B = N_B
-        return B
-    elif T == 0:
-        # If T=0, equation simplifies to B = 1 - N_B
-        return 1 - B
-    else:
+    T = np.asarray(T)
+    B = np.asarray(B)
+    if not np.isin(T, (0, 1)).all():
         raise ValueError("Treatment T must be 0 or 1")
+    if not np.isin(B, (0, 1)).all():
+        raise ValueError("Outcome B must be 0 or 1")
+    return T * B + (1 - T) * (1 - B)
 
 
-def calculate_counterfactual_outcome(deduced_nb: int, counterfactual_T: int) -> int:
+def _calculate_counterfactual_outcome(deduced_nb, counterfactual_T):
     """
     Calculates the counterfactual outcome B' given the deduced N_B and the
     new counterfactual action for T. This is the 'Prediction' step.
-    
+    Works elementwise on arrays as well as scalars.
+
     SCM equation for B: B' = T' * N_B + (1-T') * (1-N_B)
     """
-    return counterfactual_T * deduced_nb + (1 - counterfactual_T) * (1 - deduced_nb)
\ No newline at end of file
+    deduced_nb = np.asarray(deduced_nb)
+    counterfactual_T = np.asarray(counterfactual_T)
+    return counterfactual_T * deduced_nb + (1 - counterfactual_T) * (1 - deduced_nb)
+
+
+# Every variable in the SCM is binary, so both steps have only four possible
+# scalar inputs; tabulate them once at import and answer calls with a lookup.
+_NB_TABLE = {(T, B): int(_solve_for_nb(T, B)) for T in (0, 1) for B in (0, 1)}
+_CF_TABLE = {(nb, t): int(_calculate_counterfactual_outcome(nb, t)) for nb in (0, 1) for t in (0, 1)}
+
+
+def solve_for_nb(T: int, B: int) -> int:
+    """
+    Abduction step: returns N_B for the observed T and B (see `_solve_for_nb`).
+    Scalars are looked up in a table and returned as int; arrays are solved
+    elementwise. Raises ValueError if T or B is not 0 or 1.
+    """
+    try:
+        return _NB_TABLE[(T, B)]
+    except (KeyError, TypeError):
+        # Arrays are solved elementwise; invalid scalars raise in the solver
+        return _solve_for_nb(T, B)
+
+
+def calculate_counterfactual_outcome(deduced_nb: int, counterfactual_T: int) -> int:
+    """
+    Prediction step: returns B' for the deduced N_B and the counterfactual T'
+    (see `_calculate_counterfactual_outcome`). Scalars are looked up in a
+    table and returned as int; arrays are evaluated elementwise.
+    """
+    try:
+        return _CF_TABLE[(deduced_nb, counterfactual_T)]
+    except KeyError:
+        # A scalar outside the table; evaluate the SCM equation directly
+        return counterfactual_T * deduced_nb + (1 - counterfactual_T) * (1 - deduced_nb)
+    except TypeError:
+        return _calculate_counterfactual_outcome(deduced_nb, counterfactual_T)
+
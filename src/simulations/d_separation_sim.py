@@ -1,17 +1,31 @@
-import pandas as pd
+from collections import namedtuple
+
 import numpy as np
-from sklearn.linear_model import LinearRegression
 
-def generate_data(structure_type: str, n_samples: int = 300) -> pd.DataFrame:
+from src.utils import ols
+
+# The page only plots and regresses the columns, so skip building a DataFrame.
+SimResult = namedtuple('SimResult', 'X Y Z')
+
+# Noise bounds per row of the single uniform draw in generate_data: the root
+# cause(s) get U(-2, 2), the remaining variables U(-1, 1).
+_LOW, _HIGH = np.array([[-2], [-1], [-1]]), np.array([[2], [1], [1]])
+_LOW_COLLIDER, _HIGH_COLLIDER = np.array([[-2], [-2], [-1]]), np.array([[2], [2], [1]])
+
+def generate_data(structure_type: str, n_samples: int = 300, seed: int = None) -> SimResult:
     """
     Generates data for the three fundamental 3-node SCMs.
     Uses simple linear models with non-Gaussian noise to make dependencies clear.
+    Pass `seed` for a reproducible draw.
+    
+    Returns:
+        SimResult: namedtuple of np.ndarray, accessed as `.X`, `.Y` and `.Z`.
     """
+    rng = np.random.default_rng(seed)
+    
     if structure_type == 'chain':
         # X -> Z -> Y
-        n_x = np.random.uniform(-2, 2, n_samples)
-        n_z = np.random.uniform(-1, 1, n_samples)
-        n_y = np.random.uniform(-1, 1, n_samples)
+        n_x, n_z, n_y = rng.uniform(_LOW, _HIGH, (3, n_samples))
         
         x = n_x
         z = 1.5 * x + n_z
@@ -19,9 +33,7 @@ def generate_data(structure_type: str, n_samples: int = 300) -> pd.DataFrame:
         
     elif structure_type == 'fork':
         # X <- Z -> Y
-        n_z = np.random.uniform(-2, 2, n_samples)
-        n_x = np.random.uniform(-1, 1, n_samples)
-        n_y = np.random.uniform(-1, 1, n_samples)
+        n_z, n_x, n_y = rng.uniform(_LOW, _HIGH, (3, n_samples))
         
         z = n_z
         x = 1.5 * z + n_x
@@ -29,9 +41,7 @@ def generate_data(structure_type: str, n_samples: int = 300) -> pd.DataFrame:
         
     elif structure_type == 'collider':
         # X -> Z <- Y
-        n_x = np.random.uniform(-2, 2, n_samples)
-        n_y = np.random.uniform(-2, 2, n_samples)
-        n_z = np.random.uniform(-1, 1, n_samples)
+        n_x, n_y, n_z = rng.uniform(_LOW_COLLIDER, _HIGH_COLLIDER, (3, n_samples))
         
         x = n_x
         y = n_y
@@ -40,18 +50,27 @@ def generate_data(structure_type: str, n_samples: int = 300) -> pd.DataFrame:
     else:
         raise ValueError("Unknown structure type specified.")
         
-    return pd.DataFrame({'X': x, 'Y': y, 'Z': z})
+    return SimResult(X=x, Y=y, Z=z)
+
+def _column(data, name: str) -> np.ndarray:
+    # Accepts a SimResult or a DataFrame alike.
+    return np.asarray(data[name] if hasattr(data, 'columns') else getattr(data, name), dtype=float)
 
-def get_residuals(df: pd.DataFrame, var_to_regress: str, conditioning_var: str) -> np.ndarray:
+def get_residuals(data: SimResult, var_to_regress: str, conditioning_var: str) -> np.ndarray:
     """
     Calculates the residuals of var_to_regress ~ conditioning_var.
     This is used to "condition on" the conditioning_var.
     """
-    model = LinearRegression()
-    X = df[[conditioning_var]]
-    y = df[var_to_regress]
-    model.fit(X, y)
+    return ols.univariate_residuals(_column(data, conditioning_var), _column(data, var_to_regress))
+
+def get_residual_pair(data: SimResult, var_a: str, var_b: str, conditioning_var: str) -> tuple:
+    """
+    Calculates the residuals of var_a ~ conditioning_var and var_b ~ conditioning_var.
+    Both regressions share the same single regressor, so they are solved together
+    in closed form with a two-column target.
+    """
+    x = _column(data, conditioning_var)
+    targets = np.column_stack([_column(data, var_a), _column(data, var_b)])
     
-    predictions = model.predict(X)
-    residuals = y - predictions
-    return residuals
+    residuals = ols.univariate_residuals(x, targets)
+    return residuals[:, 0], residuals[:, 1]
@@ -1,8 +1,10 @@
+import functools
+
 import pandas as pd
 import numpy as np
 import graphviz
 
-def generate_m_graph_data(n_samples: int = 2000) -> pd.DataFrame:
+def generate_m_graph_data(n_samples: int = 2000, seed: int = None) -> pd.DataFrame:
     """
     Generates data from a "Bow-Tie" style graph with two hidden variables.
     
@@ -28,38 +30,35 @@ def generate_m_graph_data(n_samples: int = 2000) -> pd.DataFrame:
       (C -> E <- H2 -> D).
     - PC will (incorrectly) orient D -> E as part of the C -> E <- D v-structure.
     """
+    rng = np.random.default_rng(seed)
+    
+    # All seven noise terms in one draw, one row per variable
+    noise = rng.standard_normal((7, n_samples))
+    
     # Hidden variables
-    h1 = np.random.normal(0, 1, n_samples)
-    h2 = np.random.normal(0, 1, n_samples)
-    
-    # Exogenous noises for observed vars
-    n_a = np.random.normal(0, 0.5, n_samples)
-    n_b = np.random.normal(0, 0.5, n_samples)
-    n_c = np.random.normal(0, 0.5, n_samples)
-    n_d = np.random.normal(0, 0.5, n_samples)
-    n_e = np.random.normal(0, 0.5, n_samples)
-    
-    # Structural assignments
-    a = 2.0 * h1 + n_a
-    b = 1.5 * a + n_b
-    c = 1.0 * b + n_c
-    d = 1.5 * h2 + n_d
-    e = 1.5 * h2 + 2.0 * c + n_e
+    h1, h2 = noise[:2]
+    
+    # Exogenous noises for observed vars (sd 0.5)
+    n_a, n_b, n_c, n_d, n_e = 0.5 * noise[2:]
+    
+    # Structural assignments, written into the rows of one preallocated block
+    # (observed variables only) so the DataFrame wraps it without copying
+    out = np.empty((5, n_samples))
+    a, b, c, d, e = out
+    a[:] = 2.0 * h1 + n_a
+    b[:] = 1.5 * a + n_b
+    c[:] = 1.0 * b + n_c
+    d[:] = 1.5 * h2 + n_d
+    e[:] = 1.5 * h2 + 2.0 * c + n_e
     
     # We only return the *observed* variables
-    return pd.DataFrame({
-        'A': a, 
-        'B': b, 
-        'C': c, 
-        'D': d, 
-        'E': e
-    })
+    return pd.DataFrame(out.T, columns=['A', 'B', 'C', 'D', 'E'], copy=False)
 
 
-def get_m_graph_ground_truth_dot() -> graphviz.Digraph:
+@functools.lru_cache(maxsize=1)
+def _m_graph_ground_truth_dot() -> graphviz.Digraph:
     """
-    Returns the Graphviz object for the *true* underlying SCM,
-    including the hidden nodes H1 and H2.
+    Builds the Graphviz object for the true SCM once; see `get_m_graph_ground_truth_dot`.
     """
     dot = graphviz.Digraph(comment="True SCM with Hidden Variables")
     dot.attr(rankdir='LR')
@@ -80,6 +79,15 @@ def get_m_graph_ground_truth_dot() -> graphviz.Digraph:
     return dot
 
 
+def get_m_graph_ground_truth_dot() -> graphviz.Digraph:
+    """
+    Returns the Graphviz object for the *true* underlying SCM,
+    including the hidden nodes H1 and H2.
+    The graph never changes, so it is built once and each caller gets a copy.
+    """
+    return _m_graph_ground_truth_dot().copy()
+
+
 def get_fci_correct_output_dot() -> graphviz.Digraph:
     """
     Returns the Graphviz object for the *correct* Partial Ancestral Graph (PAG)
@@ -92,6 +100,16 @@ def get_fci_correct_output_dot() -> graphviz.Digraph:
                  algorithm is uncertain about the tail. It can't distinguish
                  C -> E from a confounded C <-> E, because of the
                  confounding environment around E.)
+    
+    Built once and copied per call like `get_m_graph_ground_truth_dot`.
+    """
+    return _fci_correct_output_dot().copy()
+
+
+@functools.lru_cache(maxsize=1)
+def _fci_correct_output_dot() -> graphviz.Digraph:
+    """
+    Builds the Graphviz object for the correct PAG once; see `get_fci_correct_output_dot`.
     """
     dot = graphviz.Digraph(comment="Correct FCI Output (PAG)")
     dot.attr(rankdir='LR')
@@ -2,9 +2,10 @@
 
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
 
-def generate_data(environment: str, n_samples: int = 200) -> pd.DataFrame:
+from src.utils import ols
+
+def generate_data(environment: str, n_samples: int = 200, seed: int = None) -> pd.DataFrame:
     """
     Generates data for the Fertilizer -> Crop Yield SCM.
     The distribution of the cause (Fertilizer) changes based on the environment,
@@ -13,6 +14,7 @@ def generate_data(environment: str, n_samples: int = 200) -> pd.DataFrame:
     Args:
         environment (str): Either "Small Farms" or "Industrial Farms".
         n_samples (int): The number of data points to generate.
+        seed (int): Optional seed for a reproducible draw.
         
     Returns:
         pd.DataFrame: A DataFrame with 'Fertilizer' and 'Crop_Yield'.
@@ -20,18 +22,19 @@ def generate_data(environment: str, n_samples: int = 200) -> pd.DataFrame:
     # Ground Truth SCM:
     # F := N_F
     # Y := 5 * F + 20 + N_Y
+    rng = np.random.default_rng(seed)
     
     if environment == "Small Farms":
         # Low-mean, low-variance fertilizer application
-        n_f = np.random.uniform(low=1, high=4, size=n_samples)
+        n_f = rng.uniform(low=1, high=4, size=n_samples)
     elif environment == "Industrial Farms":
         # High-mean, high-variance fertilizer application
-        n_f = np.random.uniform(low=5, high=10, size=n_samples)
+        n_f = rng.uniform(low=5, high=10, size=n_samples)
     else:
         raise ValueError("Unknown environment specified.")
         
     # The physical mechanism is INVARIANT across environments
-    n_y = np.random.normal(loc=0, scale=8, size=n_samples)
+    n_y = rng.normal(loc=0, scale=8, size=n_samples)
     
     # Structural Assignments
     fertilizer = n_f
@@ -44,17 +47,11 @@ def fit_and_get_equation(df: pd.DataFrame, cause_col: str, effect_col: str) -> s
     """
     Fits a linear regression model and returns the equation as a string.
     """
-    model = LinearRegression()
-    X = df[[cause_col]]
-    y = df[effect_col]
-    model.fit(X, y)
-    
-    slope = model.coef_[0]
-    intercept = model.intercept_
+    slope, intercept = ols.univariate_fit(df[cause_col].to_numpy(), df[effect_col].to_numpy())
     
     return f"{effect_col} ≈ {slope:.2f} * {cause_col} + {intercept:.2f}"
 
-def generate_lingam_data(n_samples: int = 1000) -> pd.DataFrame:
+def generate_lingam_data(n_samples: int = 1000, seed: int = None) -> pd.DataFrame:
     """
     Generates data from a Linear Non-Gaussian Acyclic Model (LiNGAM).
     
@@ -65,8 +62,9 @@ def generate_lingam_data(n_samples: int = 1000) -> pd.DataFrame:
     Y := 2*X + N_Y
     """
     # Non-Gaussian noise terms
-    n_x = np.random.uniform(low=-2, high=2, size=n_samples)
-    n_y = np.random.exponential(scale=1, size=n_samples)
+    rng = np.random.default_rng(seed)
+    n_x = rng.uniform(low=-2, high=2, size=n_samples)
+    n_y = rng.exponential(scale=1, size=n_samples)
     
     # Structural Assignments
     x = n_x
@@ -78,18 +76,12 @@ def fit_and_get_residuals(df: pd.DataFrame, cause_col: str, effect_col: str) ->
     """
     Fits a linear regression model and returns the residuals (estimated noise).
     """
-    model = LinearRegression()
-    X = df[[cause_col]]
-    y = df[effect_col]
-    model.fit(X, y)
-    
-    predictions = model.predict(X)
-    residuals = y - predictions
-    return residuals
+    residuals = ols.univariate_residuals(df[cause_col].to_numpy(), df[effect_col].to_numpy())
+    return pd.Series(residuals, index=df.index, name=effect_col)
 
 #############################
 
-def generate_ambiguous_gaussian_data(n_samples: int = 1000) -> pd.DataFrame:
+def generate_ambiguous_gaussian_data(n_samples: int = 1000, seed: int = None) -> pd.DataFrame:
     """
     Generates data for an $A -> B$ SCM with Gaussian noise,
     which is ambiguous to noise-based methods.
@@ -100,15 +92,15 @@ def generate_ambiguous_gaussian_data(n_samples: int = 1000) -> pd.DataFrame:
     A := N_A
     B := 1.5*A + N_B
     """
-    n_a = np.random.normal(loc=0, scale=1, size=n_samples)
-    n_b = np.random.normal(loc=0, scale=1, size=n_samples)
+    rng = np.random.default_rng(seed)
+    n_a, n_b = rng.standard_normal((2, n_samples))
     
     a = n_a
     b = 1.5 * a + n_b
     
     return pd.DataFrame({'A': a, 'B': b})
 
-def generate_interventional_gaussian_data(n_samples: int = 1000) -> pd.DataFrame:
+def generate_interventional_gaussian_data(n_samples: int = 1000, seed: int = None) -> pd.DataFrame:
     """
     Generates data from an intervened SCM: do(A := N(5, 1))
     The mechanism for B remains invariant.
@@ -119,11 +111,13 @@ def generate_interventional_gaussian_data(n_samples: int = 1000) -> pd.DataFrame
     A := N_A
     B := 1.5*A + N_B
     """
+    rng = np.random.default_rng(seed)
+    
     # Intervention on A: change its noise distribution
-    n_a = np.random.normal(loc=5, scale=1, size=n_samples)
+    n_a = rng.normal(loc=5, scale=1, size=n_samples)
     
     # Mechanism for B is invariant
-    n_b = np.random.normal(loc=0, scale=1, size=n_samples)
+    n_b = rng.normal(loc=0, scale=1, size=n_samples)
     
     a = n_a
     b = 1.5 * a + n_b
@@ -1,44 +1,52 @@
+from collections import namedtuple
+
 import pandas as pd
 import numpy as np
 
 # Noise is a fixed parameter of the model, not a user input.
 NOISE_STD = 1.5
 
-def generate_observational_data(n_samples: int = 1000, slope: float = 2.0) -> pd.DataFrame:
+# Plain arrays are all the plots need, so skip building a DataFrame.
+SimResult = namedtuple('SimResult', 'X Y')
+
+def generate_observational_data(n_samples: int = 1000, slope: float = 2.0, seed: int = None) -> SimResult:
     """
     Generates observational data from the ground truth LINEAR SCM: X -> Y.
-    Noise standard deviation is fixed.
+    Noise standard deviation is fixed. Pass `seed` for a reproducible draw.
+    
+    Returns:
+        SimResult: namedtuple of np.ndarray, accessed as `.X` and `.Y`.
     """
-    n_x = np.random.normal(loc=0, scale=1, size=n_samples)
-    n_y = np.random.normal(loc=0, scale=NOISE_STD, size=n_samples)
+    rng = np.random.default_rng(seed)
+    n_x, n_y = rng.standard_normal((2, n_samples))
+    n_y *= NOISE_STD
     
     x = n_x
     y = slope * x + n_y
     
-    df = pd.DataFrame({'X': x, 'Y': y})
-    return df
+    return SimResult(X=x, Y=y)
 
 
-def perform_intervention(var_name: str, value: float, n_samples: int = 1000, slope: float = 2.0) -> pd.DataFrame:
+def perform_all_interventions(x_values: list, y_values: list, n_samples: int = 1000, slope: float = 2.0, seed: int = 0) -> dict:
     """
-    Performs a hard intervention on a variable in the LINEAR SCM.
-    Noise standard deviation is fixed.
+    Performs every hard intervention do(X := v) for v in x_values and
+    do(Y := v) for v in y_values in the LINEAR SCM at once.
+    The noise for each variable is drawn in a single (n_samples, n_values) call
+    and the structural assignment is broadcast across all columns.
+    
+    Returns:
+        dict: {'X': DataFrame of Y_post_intervention with one column per value in x_values,
+               'Y': DataFrame of X_post_intervention with one column per value in y_values}
     """
-    if var_name.upper() == 'X':
-        x_intervened = np.full(n_samples, value)
-        n_y = np.random.normal(loc=0, scale=NOISE_STD, size=n_samples)
-        y_post_intervention = slope * x_intervened + n_y
-        
-        df = pd.DataFrame({'X_intervened': x_intervened, 'Y_post_intervention': y_post_intervention})
-        
-    elif var_name.upper() == 'Y':
-        y_intervened = np.full(n_samples, value)
-        n_x = np.random.normal(loc=0, scale=1, size=n_samples)
-        x_post_intervention = n_x
-        
-        df = pd.DataFrame({'X_post_intervention': x_post_intervention, 'Y_intervened': y_intervened})
-        
-    else:
-        raise ValueError("var_name must be 'X' or 'Y'")
-        
-    return df
\ No newline at end of file
+    rng = np.random.default_rng(seed)
+    
+    n_y = rng.normal(loc=0, scale=NOISE_STD, size=(n_samples, len(x_values)))
+    y_post_intervention = slope * np.asarray(x_values, dtype=float) + n_y
+    
+    # Intervening on Y leaves the mechanism for X untouched
+    x_post_intervention = rng.normal(loc=0, scale=1, size=(n_samples, len(y_values)))
+    
+    return {
+        'X': pd.DataFrame(y_post_intervention, columns=list(x_values)),
+        'Y': pd.DataFrame(x_post_intervention, columns=list(y_values))
+    }
@@ -1,10 +1,7 @@
 import pandas as pd
 import numpy as np
 
-import pandas as pd
-import numpy as np
-
-def generate_diamond_data(n_samples: int = 500) -> pd.DataFrame:
+def generate_diamond_data(n_samples: int = 500, seed: int = None) -> pd.DataFrame:
     """
     Generates data from a 4-variable 'Diamond' graph:
     A -> B
@@ -22,27 +19,22 @@ def generate_diamond_data(n_samples: int = 500) -> pd.DataFrame:
     and noise-based methods (LiNGAM) fail to find edge directions.
     """
     
-    rng = np.random.default_rng(1)
-    # Gaussian noise makes the problem maximally ambiguous
-    n_a = np.random.normal(0, 1, n_samples)
-    n_b = np.random.normal(0, 1, n_samples)
-    n_c = np.random.normal(0, 1, n_samples)
-    n_d = np.random.normal(0, 1, n_samples)
+    rng = np.random.default_rng(seed)
+    # Gaussian noise makes the problem maximally ambiguous (one draw, one row per node)
+    n_a, n_b, n_c, n_d = rng.standard_normal((4, n_samples))
     
-    A = n_a
-    B = 1.0 * A + n_b
-    C = -1.5 * A + n_c
-    D = 2.0 * B - 1.0 * C + n_d
+    # Fill the rows of one preallocated block, so the DataFrame wraps it without copying
+    out = np.empty((4, n_samples))
+    A, B, C, D = out
+    A[:] = n_a
+    B[:] = 1.0 * A + n_b
+    C[:] = -1.5 * A + n_c
+    D[:] = 2.0 * B - 1.0 * C + n_d
     
-    return pd.DataFrame({
-        'A': A,
-        'B': B,
-        'C': C,
-        'D': D
-    })
+    return pd.DataFrame(out.T, columns=['A', 'B', 'C', 'D'], copy=False)
 
 
-def generate_diamond_interventional_data(n_samples: int = 500) -> pd.DataFrame:
+def generate_diamond_interventional_data(n_samples: int = 500, seed: int = None) -> pd.DataFrame:
     """
     Intervention: do(A := N(5, 1))
     
@@ -53,28 +45,24 @@ def generate_diamond_interventional_data(n_samples: int = 500) -> pd.DataFrame:
     to a different noise type.
     """
     
-    rng = np.random.default_rng(1)
+    rng = np.random.default_rng(seed)
     
     # INTERVENTION: Shift A's distribution
-    n_a = np.random.uniform(3, 7, n_samples)  # shift to uniform
+    n_a = rng.uniform(3, 7, n_samples)  # shift to uniform
 
     
     # INVARIANCE: Same Gaussian noise for mechanisms
-    n_b = np.random.normal(0, 1, n_samples)
-    n_c = np.random.normal(0, 1, n_samples)
-    n_d = np.random.normal(0, 1, n_samples)
+    n_b, n_c, n_d = rng.standard_normal((3, n_samples))
     
-    A = n_a
-    B = 1.0 * A + n_b  # Mechanism stays the same
-    C = -1.5 * A + n_c
-    D = 2.0 * B - 1.0 * C + n_d
+    # Fill the rows of one preallocated block, as in generate_diamond_data
+    out = np.empty((4, n_samples))
+    A, B, C, D = out
+    A[:] = n_a
+    B[:] = 1.0 * A + n_b  # Mechanism stays the same
+    C[:] = -1.5 * A + n_c
+    D[:] = 2.0 * B - 1.0 * C + n_d
     
-    return pd.DataFrame({
-        'A': A,
-        'B': B,
-        'C': C,
-        'D': D
-    })
+    return pd.DataFrame(out.T, columns=['A', 'B', 'C', 'D'], copy=False)
 
 
 def get_ground_truth_graph() -> str:
@@ -0,0 +1,26 @@
+import streamlit as st
+
+st.set_page_config(
+    page_title="Causal Inference",
+    page_icon="🧠",
+    layout="wide",
+    initial_sidebar_state="expanded",
+    menu_items={
+        'About': "# This app explores Causal Inference."
+    }
+)
+
+pages = [
+    st.Page("Welcome.py", title="Welcome", icon="🧠", default=True),
+    st.Page("app_pages/0_📖_Introduction.py", title="Introduction", icon="📖", url_path="Introduction"),
+    st.Page("app_pages/1_🔬_Asymmetry_of_Interventions.py", title="Asymmetry of Interventions", icon="🔬", url_path="Asymmetry_of_Interventions"),
+    st.Page("app_pages/2_💡_Simulating_Counterfactuals.py", title="Simulating Counterfactuals", icon="💡", url_path="Simulating_Counterfactuals"),
+    st.Page("app_pages/3_🧠_Independence_of_Mechanism.py", title="Independence of Mechanism", icon="🧠", url_path="Independence_of_Mechanism"),
+    st.Page("app_pages/4_🔗_Confounding_vs_Mediation.py", title="Confounding vs. Mediation", icon="🔗", url_path="Confounding_vs_Mediation"),
+    st.Page("app_pages/5_🗺️_The_Causal_Markov_Property.py", title="The Causal Markov Property", icon="🗺️", url_path="The_Causal_Markov_Property"),
+    st.Page("app_pages/6_🧭_PC_Algorithm.py", title="PC Algorithm", icon="🧭", url_path="PC_Algorithm"),
+    st.Page("app_pages/7_👻_Hidden_Confounding_and_FCI.py", title="Hidden Confounding & FCI", icon="👻", url_path="Hidden_Confounding_and_FCI"),
+    st.Page("app_pages/8_🏁_Conclusion.py", title="Conclusion", icon="🏁", url_path="Conclusion"),
+]
+
+st.navigation(pages, position="sidebar").run()